@@ -8,7 +8,7 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class LunaAPIClient:
-    def __init__(self, base_url: str = "https://luna-s-endless-lessons.onrender.com"):
+    def __init__(self, base_url: str = "https://luna-s-endless-lessons.onrender.com", game_settings: Optional[GameSettings] = None):
         self.base_url = base_url.rstrip('/')
         self.session = requests.Session()
         
@@ -20,7 +20,7 @@ class LunaAPIClient:
         
         self.session.timeout = 10
         
-        self.game_settings = GameSettings()
+        self.game_settings = game_settings if game_settings is not None else GameSettings()
         
         self._player_data_cache = None
         self._cache_timestamp = 0
@@ -584,6 +584,18 @@ def get_api_client() -> LunaAPIClient:
     """Get the global API client instance"""
     return api_client
 
+# Client used only by the level's single background worker thread (created on first use).
+# requests.Session is not guaranteed thread-safe, so workers get their own session and
+# player-data cache; game settings are shared so both clients use the same system ID.
+_worker_api_client = None
+
+def get_worker_api_client() -> LunaAPIClient:
+    """Get the API client reserved for background threads"""
+    global _worker_api_client
+    if _worker_api_client is None:
+        _worker_api_client = LunaAPIClient(api_client.base_url, game_settings=api_client.game_settings)
+    return _worker_api_client
+
 def test_api_connection() -> bool:
     """Test API connection and return status"""
     try:
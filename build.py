@@ -196,6 +196,10 @@ def main():
     # Set up hidden configuration
     create_hidden_config()
     
+    # Pre-scale background layers so the shipped game skips scaling at load
+    if not run_command(f'"{sys.executable}" prescale_backgrounds.py', "Pre-scaling background layers"):
+        print("⚠️ Continuing with unscaled background layers")
+    
     # Build executable
     if not build_executable():
         print("❌ Build failed")
@@ -1,6 +1,8 @@
 
 WIDTH, HEIGHT = 800, 640
 FPS = 60
+DEBUG = False  # Enables per-frame diagnostic prints
+DEBUG_HITBOXES = False  # Outlines attack and pickup hitboxes on screen
 GRAVITY = 0.8
 GROUND_HEIGHT = 200
 SCALE = 3
@@ -11,5 +13,7 @@ CROP_HEIGHT_ATTACK_1 = 43
 CROP_HEIGHT_ATTACK_2 = 43
 
 TILE_SIZE = 32
+WORLD_WIDTH = 100 * TILE_SIZE  # Maps are 100 tiles wide
+ENEMY_CULL_MARGIN = 256  # Pixels beyond the screen edge where slimes keep running AI
 
 SCALE = 3.2
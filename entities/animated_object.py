@@ -1,6 +1,9 @@
 import pygame
 from entities.animation import Animation, AnimationManager
 
+# Tiles an animated object can walk along: platforms (34, 35), ground (2) and platform (12)
+PLATFORM_TILE_IDS = frozenset({34, 35, 2, 12})
+
 class AnimatedObject(pygame.sprite.Sprite):
     """Animated object that moves back and forth with walk animation and attacks player"""
     
@@ -103,10 +106,11 @@ class AnimatedObject(pygame.sprite.Sprite):
         
         # Check for player and determine behavior
         if player:
-            player_distance = self.get_distance_to_player(player)
+            # Compare squared distances so the range check needs no square root
+            player_distance_sq = self.get_squared_distance_to_player(player)
             
             # If player is within attack range, start following/attacking
-            if player_distance <= self.attack_range:
+            if player_distance_sq <= self.attack_range * self.attack_range:
                 if not self.is_attacking:
                     self.is_attacking = True
                     print("Animated object started following player!")
@@ -180,6 +184,12 @@ class AnimatedObject(pygame.sprite.Sprite):
         dy = player.rect.centery - self.rect.centery
         return (dx * dx + dy * dy) ** 0.5
     
+    def get_squared_distance_to_player(self, player):
+        """Calculate squared distance to player (for range checks)"""
+        dx = player.rect.centerx - self.rect.centerx
+        dy = player.rect.centery - self.rect.centery
+        return dx * dx + dy * dy
+    
     def follow_player(self, player):
         """Follow the player while staying within movement region"""
         # Calculate direction to player
@@ -239,7 +249,7 @@ class AnimatedObject(pygame.sprite.Sprite):
     
     def check_platform_collision(self, level):
         """Check if standing on a platform tile and adjust movement bounds"""
-        if not hasattr(level, 'is_position_on_tile_id'):
+        if not hasattr(level, 'tile_id_at'):
             return
         
         # Check multiple points to make platform detection more stable
@@ -252,10 +262,7 @@ class AnimatedObject(pygame.sprite.Sprite):
         
         on_platform = False
         for check_x, check_y in check_points:
-            if (level.is_position_on_tile_id(check_x, check_y, 34) or 
-                level.is_position_on_tile_id(check_x, check_y, 35) or
-                level.is_position_on_tile_id(check_x, check_y, 2) or  # Also check for ground tiles (tile 2)
-                level.is_position_on_tile_id(check_x, check_y, 12)):  # Also check for platform tiles (tile 12)
+            if level.tile_id_at(check_x, check_y) in PLATFORM_TILE_IDS:
                 on_platform = True
                 break
         
@@ -287,10 +294,7 @@ class AnimatedObject(pygame.sprite.Sprite):
         while left_x >= 0:
             check_x = left_x * 32 + 16
             check_y = tile_y * 32 + 16
-            if (level.is_position_on_tile_id(check_x, check_y, 34) or 
-                level.is_position_on_tile_id(check_x, check_y, 35) or
-                level.is_position_on_tile_id(check_x, check_y, 2) or  # Also check for ground tiles (tile 2)
-                level.is_position_on_tile_id(check_x, check_y, 12)):  # Also check for platform tiles (tile 12)
+            if level.tile_id_at(check_x, check_y) in PLATFORM_TILE_IDS:
                 left_x -= 1
             else:
                 break
@@ -301,10 +305,7 @@ class AnimatedObject(pygame.sprite.Sprite):
         while right_x < 100:
             check_x = right_x * 32 + 16
             check_y = tile_y * 32 + 16
-            if (level.is_position_on_tile_id(check_x, check_y, 34) or 
-                level.is_position_on_tile_id(check_x, check_y, 35) or
-                level.is_position_on_tile_id(check_x, check_y, 2) or  # Also check for ground tiles (tile 2)
-                level.is_position_on_tile_id(check_x, check_y, 12)):  # Also check for platform tiles (tile 12)
+            if level.tile_id_at(check_x, check_y) in PLATFORM_TILE_IDS:
                 right_x += 1
             else:
                 break
@@ -2,19 +2,26 @@ import pygame
 import json
 import os
 
-class Animation:
-    
-    def __init__(self, spritesheet_path, json_path, scale=1.0):
-        self.spritesheet = pygame.image.load(spritesheet_path).convert_alpha()
-        self.scale = scale
+# Sliced/scaled frames shared by every Animation, keyed by (spritesheet_path, json_path, scale)
+_FRAME_CACHE = {}
+
+# Left-facing copies of cached frames, keyed by the right-facing frame Surface
+_FLIPPED_FRAMES = {}
+
+
+def _load_frames(spritesheet_path, json_path, scale):
+    """Slice and scale a sprite sheet once; later calls reuse the same frame list"""
+    key = (spritesheet_path, json_path, scale)
+    if key not in _FRAME_CACHE:
+        spritesheet = pygame.image.load(spritesheet_path).convert_alpha()
         
         with open(json_path, 'r') as f:
-            self.data = json.load(f)
+            data = json.load(f)
         
-        self.frames = []
-        self.frame_durations = []
+        frames = []
+        frame_durations = []
         
-        for frame_name, frame_data in self.data['frames'].items():
+        for frame_name, frame_data in data['frames'].items():
             frame_info = frame_data['frame']
             duration = frame_data['duration']
             
@@ -24,14 +31,25 @@ class Animation:
             h = frame_info['h']
             
             frame_surface = pygame.Surface((w, h), pygame.SRCALPHA)
-            frame_surface.blit(self.spritesheet, (0, 0), (x, y, w, h))
+            frame_surface.blit(spritesheet, (0, 0), (x, y, w, h))
             
             if scale != 1.0:
                 frame_surface = pygame.transform.scale(frame_surface, 
                                                      (int(w * scale), int(h * scale)))
             
-            self.frames.append(frame_surface)
-            self.frame_durations.append(duration)
+            frames.append(frame_surface)
+            frame_durations.append(duration)
+        
+        _FRAME_CACHE[key] = (frames, frame_durations)
+    return _FRAME_CACHE[key]
+
+
+class Animation:
+    
+    def __init__(self, spritesheet_path, json_path, scale=1.0):
+        self.scale = scale
+        # Frame lists are shared between instances, so only ever rebind them (never mutate)
+        self.frames, self.frame_durations = _load_frames(spritesheet_path, json_path, scale)
         
         self.current_frame = 0
         self.frame_timer = 0
@@ -94,7 +112,12 @@ class AnimationManager:
         if self.current_animation and self.current_animation in self.animations:
             frame = self.animations[self.current_animation].get_current_frame()
             if not self.facing_right:
-                frame = pygame.transform.flip(frame, True, False)
+                # Flip each frame once and reuse it, instead of allocating a new Surface every draw
+                flipped = _FLIPPED_FRAMES.get(frame)
+                if flipped is None:
+                    flipped = pygame.transform.flip(frame, True, False)
+                    _FLIPPED_FRAMES[frame] = flipped
+                frame = flipped
             return frame
         return None
     
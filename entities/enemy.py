@@ -42,6 +42,7 @@ class Enemy(pygame.sprite.Sprite):
         
         # Projectile system
         self.projectiles = pygame.sprite.Group()
+        self.shared_projectiles = None  # Level-wide group that also receives new projectiles
         self.shoot_cooldown = 0
         self.shoot_delay = 90  # frames between shots (slower shooting)
         
@@ -139,13 +140,11 @@ class Enemy(pygame.sprite.Sprite):
             self.rect.centerx += dx
             # Keep enemy at ground level (don't change Y position)
             
-            # Check collision with walls
-            for sprite in collision_sprites:
-                if self.rect.colliderect(sprite.rect):
-                    # Revert movement if collision detected
-                    self.rect.centerx = old_x
-                    self.rect.centery = old_y
-                    break
+            # Check collision with walls (only tiles in nearby grid cells)
+            if collision_sprites.first_hit(self.rect) is not None:
+                # Revert movement if collision detected
+                self.rect.centerx = old_x
+                self.rect.centery = old_y
     
     def move_between_waypoints(self, collision_sprites):
         """Move between waypoints in a random order"""
@@ -153,9 +152,9 @@ class Enemy(pygame.sprite.Sprite):
             return
             
         # Check if reached current waypoint
-        distance_to_target = math.sqrt(
-            (self.rect.centerx - self.target_waypoint[0]) ** 2 + 
-            (self.rect.centery - self.target_waypoint[1]) ** 2
+        distance_to_target = math.hypot(
+            self.rect.centerx - self.target_waypoint[0],
+            self.rect.centery - self.target_waypoint[1]
         )
         
         if distance_to_target < 5:  # Close enough to waypoint
@@ -167,7 +166,7 @@ class Enemy(pygame.sprite.Sprite):
         # Move towards target waypoint
         dx = self.target_waypoint[0] - self.rect.centerx
         dy = self.target_waypoint[1] - self.rect.centery
-        distance = math.sqrt(dx ** 2 + dy ** 2)
+        distance = math.hypot(dx, dy)
         
         if distance > 0:
             # Normalize direction and apply speed
@@ -181,13 +180,11 @@ class Enemy(pygame.sprite.Sprite):
             self.rect.centerx += dx
             self.rect.centery += dy
             
-            # Check collision with walls
-            for sprite in collision_sprites:
-                if self.rect.colliderect(sprite.rect):
-                    # Revert movement if collision detected
-                    self.rect.centerx = old_x
-                    self.rect.centery = old_y
-                    break
+            # Check collision with walls (only tiles in nearby grid cells)
+            if collision_sprites.first_hit(self.rect) is not None:
+                # Revert movement if collision detected
+                self.rect.centerx = old_x
+                self.rect.centery = old_y
     
     def shoot_at_player(self, player):
         """Shoot projectile at player"""
@@ -195,7 +192,7 @@ class Enemy(pygame.sprite.Sprite):
             # Calculate direction to player
             dx = self.last_player_pos[0] - self.rect.centerx
             dy = self.last_player_pos[1] - self.rect.centery
-            distance = math.sqrt(dx ** 2 + dy ** 2)
+            distance = math.hypot(dx, dy)
             
             if distance > 0:
                 # Normalize direction
@@ -210,6 +207,8 @@ class Enemy(pygame.sprite.Sprite):
                     dy
                 )
                 self.projectiles.add(projectile)
+                if self.shared_projectiles is not None:
+                    self.shared_projectiles.add(projectile)
                 self.shoot_cooldown = self.shoot_delay
     
     def take_damage(self, damage):
@@ -332,12 +331,11 @@ class Projectile(pygame.sprite.Sprite):
         self.rect.centerx += self.dx
         self.rect.centery += self.dy
         
-        # Check collision with walls
-        for sprite in collision_sprites:
-            if self.rect.colliderect(sprite.rect):
-                self.create_particles()
-                self.kill()
-                return
+        # Check collision with walls (only tiles in nearby grid cells)
+        if collision_sprites.first_hit(self.rect) is not None:
+            self.create_particles()
+            self.kill()
+            return
         
         # Check if projectile is too old
         if self.age >= self.lifetime:
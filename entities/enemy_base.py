@@ -46,6 +46,7 @@ class BaseEnemy(pygame.sprite.Sprite):
         
         # Projectile system
         self.projectiles = pygame.sprite.Group()
+        self.shared_projectiles = None  # Level-wide group that also receives new projectiles
         self.shoot_cooldown = 0
         self.shoot_delay = 90
         
@@ -160,25 +161,21 @@ class BaseEnemy(pygame.sprite.Sprite):
             
             self.rect.centerx += dx
             
-            # Check collision with walls
-            for sprite in collision_sprites:
-                if self.rect.colliderect(sprite.rect):
-                    self.rect.centerx = old_x
-                    self.rect.centery = old_y
-                    break
+            # Check collision with walls (only tiles in nearby grid cells)
+            if collision_sprites.first_hit(self.rect) is not None:
+                self.rect.centerx = old_x
+                self.rect.centery = old_y
     
     def move_between_waypoints(self, collision_sprites):
         """Move between waypoints when player is not in range"""
         if not self.waypoints or len(self.waypoints) <= 1:
             return
             
-        # Check if reached current waypoint
-        distance_to_target = math.sqrt(
-            (self.rect.centerx - self.target_waypoint[0]) ** 2 + 
-            (self.rect.centery - self.target_waypoint[1]) ** 2
-        )
+        # Check if reached current waypoint (squared distance, no sqrt needed)
+        tx = self.rect.centerx - self.target_waypoint[0]
+        ty = self.rect.centery - self.target_waypoint[1]
         
-        if distance_to_target < 5:
+        if tx * tx + ty * ty < 25:  # Within 5px
             available_waypoints = [wp for wp in self.waypoints if wp != self.target_waypoint]
             if available_waypoints:
                 self.target_waypoint = random.choice(available_waypoints)
@@ -186,7 +183,7 @@ class BaseEnemy(pygame.sprite.Sprite):
         # Move towards target waypoint
         dx = self.target_waypoint[0] - self.rect.centerx
         dy = self.target_waypoint[1] - self.rect.centery
-        distance = math.sqrt(dx ** 2 + dy ** 2)
+        distance = math.hypot(dx, dy)
         
         if distance > 0:
             dx = (dx / distance) * self.speed
@@ -205,12 +202,10 @@ class BaseEnemy(pygame.sprite.Sprite):
                 self.facing_right = False
             self.animation_manager.set_facing(self.facing_right)
             
-            # Check collision with walls
-            for sprite in collision_sprites:
-                if self.rect.colliderect(sprite.rect):
-                    self.rect.centerx = old_x
-                    self.rect.centery = old_y
-                    break
+            # Check collision with walls (only tiles in nearby grid cells)
+            if collision_sprites.first_hit(self.rect) is not None:
+                self.rect.centerx = old_x
+                self.rect.centery = old_y
     
     def attack_player(self, player):
         """Attack the player - to be overridden by specific enemy types"""
@@ -126,9 +126,8 @@ class Heart(pygame.sprite.Sprite):
         if not self.collected:
             surface.blit(self.image, camera_offset)
             
-            # Debug: Draw collision area (uncomment for testing)
-            # pygame.draw.rect(surface, (255, 0, 0), 
-            #                 (self.collision_rect.x - camera_offset[0], 
-            #                  self.collision_rect.y - camera_offset[1], 
-            #                  self.collision_rect.width, 
-            #                  self.collision_rect.height), 1)
+            # Debug: Draw collision area (camera_offset is where the heart's rect lands on screen)
+            if DEBUG_HITBOXES:
+                pygame.draw.rect(surface, (255, 0, 0),
+                                 self.collision_rect.move(camera_offset[0] - self.rect.x,
+                                                          camera_offset[1] - self.rect.y), 1)
@@ -1,5 +1,6 @@
 import pygame
 from config import *
+from fonts import get_font
 
 # Heart image will be loaded when first needed
 HEART_IMAGE = None
@@ -167,7 +168,7 @@ class Inventory:
             pygame.draw.rect(screen, (150, 150, 150), (slot_x, slot_y, slot_size, slot_size), 1)
             
             # Draw slot number (1-5 for keys 1-5)
-            font = pygame.font.Font(None, 16)
+            font = get_font(16)
             slot_number = i + 1  # 1-5 for 5 slots
             number_text = font.render(str(slot_number), True, (255, 255, 255))
             screen.blit(number_text, (slot_x + 2, slot_y + 2))
@@ -190,17 +191,17 @@ class Inventory:
                     
                     # Draw quantity
                     if item['quantity'] > 1:
-                        font = pygame.font.Font(None, 16)
+                        font = get_font(16)
                         quantity_text = font.render(str(item['quantity']), True, (255, 255, 255))
                         screen.blit(quantity_text, (slot_x + slot_size - 15, slot_y + slot_size - 15))
         
         # Draw inventory title
-        font = pygame.font.Font(None, 20)
+        font = get_font(20)
         title_text = font.render("Inventory", True, (255, 255, 255))
         screen.blit(title_text, (x, y - 25))
         
         # Draw instructions
-        instruction_font = pygame.font.Font(None, 16)
+        instruction_font = get_font(16)
         if self.is_open:
             instructions = [
                 "Use LEFT/RIGHT arrows to navigate",
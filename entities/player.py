@@ -1,8 +1,67 @@
+import os
 import pygame
 from entities.bow import Bow
 from entities.inventory import Inventory
 from story_progression import StoryProgression
 from config import *
+from fonts import get_font
+
+# Scaled/flipped animation frames shared by every Player, keyed by (path, SCALE, crop)
+_FRAME_CACHE = {}
+
+# Rendered "Health: x/y" surfaces shared by every Player (survive respawns)
+_HP_TEXT_CACHE = {}
+
+# Key constants bound once at import so update() reads module globals, not pygame attributes
+_K_LEFT = pygame.K_LEFT
+_K_RIGHT = pygame.K_RIGHT
+_K_SPACE = pygame.K_SPACE
+_K_F = pygame.K_f
+_K_E = pygame.K_e
+_K_I = pygame.K_i
+_K_U = pygame.K_u
+_K_W = pygame.K_w
+
+# Number keys that highlight inventory slots, in slot order
+_SLOT_KEYS = (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5)
+
+# Player center limits: half the 24px collision box inside each map edge
+_MAP_LEFT_BOUND = 12
+_MAP_RIGHT_BOUND = WORLD_WIDTH - 12
+
+# Sword animation frame at which the hitbox is tested (once per swing)
+_SWORD_IMPACT_FRAME = 2
+
+
+def _load_frames(path, cols, crop):
+    """Load a sprite sheet once and return its (right, left) facing frame lists"""
+    key = (path, SCALE, crop)
+    if key not in _FRAME_CACHE:
+        sheet = pygame.image.load(path).convert_alpha()
+        # Crop and scale the whole sheet once, then slice frames as subsurface views
+        cropped = sheet.subsurface(pygame.Rect(0, 0, sheet.get_width(), sheet.get_height() - crop))
+        new_w = int(cropped.get_width() * SCALE)
+        new_h = int(cropped.get_height() * SCALE)
+        # convert_alpha keeps both facings in display format so their blits take SDL's fast path
+        scaled = pygame.transform.scale(cropped, (new_w, new_h)).convert_alpha()
+        frame_w = new_w // cols
+        right = [scaled.subsurface(pygame.Rect(i * frame_w, 0, frame_w, new_h)) for i in range(cols)]
+        # The scaled sheet is already a contiguous strip: flip it in one pass, frame order reverses
+        flipped = pygame.transform.flip(scaled, True, False).convert_alpha()
+        left = [flipped.subsurface(pygame.Rect(new_w - (i + 1) * frame_w, 0, frame_w, new_h)) for i in range(cols)]
+        _FRAME_CACHE[key] = (right, left)
+    return _FRAME_CACHE[key]
+
+
+def _health_text(health, max_health):
+    """Return the rendered health label, rendering each (health, max_health) pair only once"""
+    key = (health, max_health)
+    text = _HP_TEXT_CACHE.get(key)
+    if text is None:
+        text = get_font(24).render(f"Health: {health}/{max_health}", True, (255, 255, 255))
+        _HP_TEXT_CACHE[key] = text
+    return text
+
 
 class Player(pygame.sprite.Sprite):
     def __init__(self, story_progression=None):
@@ -10,58 +69,36 @@ class Player(pygame.sprite.Sprite):
         
         self.story_progression = story_progression or StoryProgression()
 
-        walk_sheet = pygame.image.load("Soldier-Walk.png").convert_alpha()
-        attack1_sheet = pygame.image.load("Soldier-Attack01.png").convert_alpha()
-        attack2_sheet = pygame.image.load("Soldier-Attack03.png").convert_alpha()
-
-        walk_frame_w = walk_sheet.get_width() // 8
-        walk_frame_h = walk_sheet.get_height()
-        walk_frames = [
-            pygame.transform.scale(
-                walk_sheet.subsurface(pygame.Rect(i * walk_frame_w, 0, walk_frame_w, walk_frame_h - CROP_HEIGHT_WALK)),
-                (walk_frame_w * SCALE, (walk_frame_h - CROP_HEIGHT_WALK) * SCALE)
-            )
-            for i in range(8)
-        ]
-
-        attack1_frame_w = attack1_sheet.get_width() // 6
-        attack1_frame_h = attack1_sheet.get_height()
-        attack1_frames = [
-            pygame.transform.scale(
-                attack1_sheet.subsurface(pygame.Rect(i * attack1_frame_w, 0, attack1_frame_w, attack1_frame_h - CROP_HEIGHT_ATTACK_1)),
-                (attack1_frame_w * SCALE, (attack1_frame_h - CROP_HEIGHT_ATTACK_1) * SCALE)
-            )
-            for i in range(6)
-        ]
-
-
-        attack2_frame_w = attack2_sheet.get_width() // 9
-        attack2_frame_h = attack2_sheet.get_height()
-        attack2_frames = [
-            pygame.transform.scale(
-                attack2_sheet.subsurface(pygame.Rect(i * attack2_frame_w, 0, attack2_frame_w, attack2_frame_h - CROP_HEIGHT_ATTACK_2)),
-                (attack2_frame_w * SCALE, (attack2_frame_h - CROP_HEIGHT_ATTACK_2) * SCALE)
-            )
-            for i in range(9)
-        ]
-
-        self.walk_frames_right = walk_frames
-        self.walk_frames_left = [pygame.transform.flip(f, True, False) for f in self.walk_frames_right]
-
-        self.attack1_frames_right = attack1_frames
-        self.attack1_frames_left = [pygame.transform.flip(f, True, False) for f in self.attack1_frames_right]
-
-        self.attack2_frames_right = attack2_frames
-        self.attack2_frames_left = [pygame.transform.flip(f, True, False) for f in self.attack2_frames_right]
+        self.walk_frames_right, self.walk_frames_left = _load_frames("Soldier-Walk.png", 8, CROP_HEIGHT_WALK)
+        self.attack1_frames_right, self.attack1_frames_left = _load_frames("Soldier-Attack01.png", 6, CROP_HEIGHT_ATTACK_1)
+        self.attack2_frames_right, self.attack2_frames_left = _load_frames("Soldier-Attack03.png", 9, CROP_HEIGHT_ATTACK_2)
 
         self.current_attack_frames_right = self.attack1_frames_right
         self.current_attack_frames_left = self.attack1_frames_left
 
+        # (left, right) frame pairs so animation picks index by facing_right directly
+        self._walk_frames = (self.walk_frames_left, self.walk_frames_right)
+        self._attack1_frames = (self.attack1_frames_left, self.attack1_frames_right)
+        self._attack2_frames = (self.attack2_frames_left, self.attack2_frames_right)
+        self._attack_frames = self._attack1_frames
+
+        # Frame counts cached so the animation checks don't call len() every frame
+        self._walk_count = len(self.walk_frames_right)
+        self._attack1_count = len(self.attack1_frames_right)
+        self._attack2_count = len(self.attack2_frames_right)
+        self._attack_count = self._attack1_count
+
         self.index = 0
         self.image = self.walk_frames_right[0]
         self.rect = self.image.get_rect()
         
         self.collision_rect = pygame.Rect(0, 0, 24, self.rect.height)
+        # Scratch copy of the collision box that check_collision moves to each probe position
+        self._collision_probe = self.collision_rect.copy()
+        # Sword attack hitbox (60x60), repositioned in place on each attack frame
+        self._attack_hitbox = pygame.Rect(0, 0, 60, 60)
+        # Hitbox top-left offset from the player's center, indexed by facing_right (left, right)
+        self._attack_hitbox_offsets = ((-60, -30), (0, -30))
 
         self.vel_y = 0
         self.on_ground = True
@@ -69,10 +106,10 @@ class Player(pygame.sprite.Sprite):
         self.walking = False
         self.attacking = False
         self.attack_index = 0
+        self._attack_hit_done = False
         self.weapon_switched = False
         
         self.current_weapon = 'sword'
-        self.weapon_switch_cooldown = 0
         self.can_use_bow = self.story_progression.can_use_bow()
         
         if not self.can_use_bow:
@@ -85,11 +122,19 @@ class Player(pygame.sprite.Sprite):
         self.invulnerability_timer = 0
         
         self.inventory = Inventory()
-        self.inventory_toggle_cooldown = 0
-        self.heart_use_cooldown = 0
         
         self.can_use_hearts = self.story_progression.can_use_hearts()
-        
+        # Saved inventory is read on the first update so respawning stays cheap
+        self._inventory_loaded = False
+        # (mtime_ns, size) of the save file when it was last synced
+        self._last_progress_stat = None
+
+    def _ensure_inventory_loaded(self):
+        """Load the saved inventory once, the first time it is needed"""
+        if self._inventory_loaded:
+            return
+        self._inventory_loaded = True
+
         if self.can_use_hearts:
             saved_inventory = self.story_progression.load_inventory()
             self.inventory.items = saved_inventory.copy()
@@ -100,25 +145,22 @@ class Player(pygame.sprite.Sprite):
 
     def check_collision(self, dx, dy, collision_sprites):
         """Advanced collision detection that handles edge cases and platform tiles"""
-        # Create a test rect for collision detection using the smaller collision box
-        test_rect = self.collision_rect.copy()
-        test_rect.centerx = self.rect.centerx + dx
-        test_rect.bottom = self.rect.bottom + dy
+        # Move the reusable collision-box probe to the tested position (no Rect allocated per call)
+        test_rect = self._collision_probe
+        test_rect.midbottom = (self.rect.centerx + dx, self.rect.bottom + dy)
         
-        # Check for collisions
-        for sprite in collision_sprites:
-            if test_rect.colliderect(sprite.rect):
-                # Check if this is a platform tile
-                if hasattr(sprite, 'is_platform') and sprite.is_platform:
-                    # For platform tiles, only allow collision from above (falling down)
-                    if dy > 0:  # Player is falling down
-                        # Pixel-perfect collision: player's bottom must be at or above platform's top
-                        if self.rect.bottom <= sprite.rect.top:
-                            return True, sprite
-                    # If player is moving up or horizontally, ignore platform collision
-                    continue
-                else:
-                    # Regular solid tile collision
+        # Regular solid tile collision (only tiles near the test rect are checked)
+        hit = collision_sprites.first_solid_hit(test_rect)
+        if hit is not None:
+            return True, hit
+        
+        # For platform tiles, only allow collision from above (falling down)
+        if dy > 0:
+            platforms = collision_sprites.platforms_near(test_rect)
+            for index in test_rect.collidelistall(platforms):
+                sprite = platforms[index]
+                # Pixel-perfect collision: player's bottom must be at or above platform's top
+                if self.rect.bottom <= sprite.rect.top:
                     return True, sprite
         return False, None
     
@@ -127,192 +169,171 @@ class Player(pygame.sprite.Sprite):
         if not self.attacking or not enemy_sprites:
             return
         
-        # Create attack hitbox based on attack frame and direction
+        # Only frames within the current attack animation have a hitbox
         attack_frame = int(self.attack_index)
         
-        if attack_frame >= len(self.current_attack_frames_right):
+        if attack_frame >= self._attack_count:
             return
         
-        # Create a hitbox for the sword attack
-        # The hitbox extends in front of the player based on direction
-        hitbox_width = 60  # Width of the attack hitbox
-        hitbox_height = 60  # Height of the attack hitbox
+        # Move the reusable sword hitbox in front of the player based on direction
+        attack_hitbox = self._attack_hitbox
+        offset_x, offset_y = self._attack_hitbox_offsets[self.facing_right]
+        center_x, center_y = self.rect.center
+        attack_hitbox.topleft = (center_x + offset_x, center_y + offset_y)
         
-        if self.facing_right:
-            # Attack hitbox extends to the right
-            hitbox_x = self.rect.centerx  # Start at player center
-            hitbox_y = self.rect.centery - hitbox_height // 2
-        else:
-            # Attack hitbox extends to the left
-            hitbox_x = self.rect.centerx - hitbox_width  # Start at player center
-            hitbox_y = self.rect.centery - hitbox_height // 2
-        
-        attack_hitbox = pygame.Rect(hitbox_x, hitbox_y, hitbox_width, hitbox_height)
-        
-        # Check collision with enemy tiles
-        for enemy in enemy_sprites:
-            if hasattr(enemy, 'tile_id') and enemy.tile_id in [41, 42]:  # Check if it's an enemy tile
-                if attack_hitbox.colliderect(enemy.rect):
-                    print(f"ATTACK HIT! Enemy tile ID {enemy.tile_id} at position ({enemy.rect.x}, {enemy.rect.y})")
-                    # You can add more logic here like removing the enemy, dealing damage, etc.
-
-    def update(self, keys, collision_sprites, enemy_sprites=None, dialogue_active=False):
+        # Check collision with enemy tiles (already filtered to attackable tile IDs by the level)
+        for index in attack_hitbox.collidelistall(enemy_sprites):
+            enemy = enemy_sprites[index]
+            if DEBUG:
+                print(f"ATTACK HIT! Enemy tile ID {enemy.tile_id} at position ({enemy.rect.x}, {enemy.rect.y})")
+            # You can add more logic here like removing the enemy, dealing damage, etc.
+
+    def update(self, keys, collision_sprites, enemy_sprites=None, dialogue_active=False, pressed_keys=()):
+        """Move and animate the player; keys is the held-key state, pressed_keys the keys pressed this frame"""
+        self._ensure_inventory_loaded()
+        # Movement and attack are held keys; menu actions fire once per key press
+        k_left = keys[_K_LEFT]
+        k_right = keys[_K_RIGHT]
+        k_space = keys[_K_SPACE]
+        k_f = keys[_K_F]
+        k_e = _K_E in pressed_keys
+        k_i = _K_I in pressed_keys
+        k_u = _K_U in pressed_keys
+        k_w = _K_W in pressed_keys
+
         dx = 0
         self.walking = False
 
-        # Update weapon switch cooldown
-        if self.weapon_switch_cooldown > 0:
-            self.weapon_switch_cooldown -= 1
-        
-        # Update inventory and heart use cooldowns
-        if self.inventory_toggle_cooldown > 0:
-            self.inventory_toggle_cooldown -= 1
-        if self.heart_use_cooldown > 0:
-            self.heart_use_cooldown -= 1
-        
         # Update inventory state
         self.inventory.update()
 
         # Only allow movement, direction changes, and jumping if not attacking, not in inventory navigation mode, and not in dialogue
         if not self.attacking and not self.inventory.is_open and not dialogue_active:
-            if keys[pygame.K_RIGHT]:
+            if k_right:
                 dx = 4
                 self.facing_right = True
                 self.walking = True
-            elif keys[pygame.K_LEFT]:
+            elif k_left:
                 dx = -4
                 self.facing_right = False
                 self.walking = True
 
-            if keys[pygame.K_SPACE] and self.on_ground:
+            if k_space and self.on_ground:
                 self.vel_y = -JUMP_STRENGTH
                 self.on_ground = False
 
             # Weapon switching (E key) - only if bow is unlocked
-            if keys[pygame.K_e] and self.weapon_switch_cooldown <= 0 and self.can_use_bow:
+            if k_e and self.can_use_bow:
                 if self.current_weapon == 'sword':
                     self.current_weapon = 'bow'
                     self.current_attack_frames_right = self.attack2_frames_right
                     self.current_attack_frames_left = self.attack2_frames_left
-                    print("Switched to BOW weapon")
+                    self._attack_frames = self._attack2_frames
+                    self._attack_count = self._attack2_count
+                    if DEBUG:
+                        print("Switched to BOW weapon")
                 else:
                     self.current_weapon = 'sword'
                     self.current_attack_frames_right = self.attack1_frames_right
                     self.current_attack_frames_left = self.attack1_frames_left
-                    print("Switched to SWORD weapon")
-                self.weapon_switch_cooldown = 30
-            elif keys[pygame.K_e] and not self.can_use_bow:
-                print("Bow not yet unlocked! Die to progress the story...")
+                    self._attack_frames = self._attack1_frames
+                    self._attack_count = self._attack1_count
+                    if DEBUG:
+                        print("Switched to SWORD weapon")
+            elif k_e and not self.can_use_bow:
+                if DEBUG:
+                    print("Bow not yet unlocked! Die to progress the story...")
 
-            if keys[pygame.K_f]:
+            if k_f:
                 # Only allow attacking if current weapon is available
                 if self.current_weapon == 'sword' or (self.current_weapon == 'bow' and self.can_use_bow):
                     self.attacking = True
                     self.attack_index = 0
+                    self._attack_hit_done = False
                 elif self.current_weapon == 'bow' and not self.can_use_bow:
-                    print("Bow not yet unlocked! Die to progress the story...")
+                    if DEBUG:
+                        print("Bow not yet unlocked! Die to progress the story...")
             
             # Enter inventory navigation (I key) - only when not in navigation mode and hearts unlocked
-            if keys[pygame.K_i] and self.inventory_toggle_cooldown <= 0 and self.can_use_hearts:
+            if k_i and self.can_use_hearts:
                 if not self.inventory.is_open:
                     self.inventory.is_open = True
-                    print("Entered inventory navigation mode")
-                    self.inventory_toggle_cooldown = 5  # 5 frames cooldown
-            elif keys[pygame.K_i] and not self.can_use_hearts:
-                print("Inventory not yet unlocked! Die to progress the story...")
+                    if DEBUG:
+                        print("Entered inventory navigation mode")
+            elif k_i and not self.can_use_hearts:
+                if DEBUG:
+                    print("Inventory not yet unlocked! Die to progress the story...")
             
             # Select items with number keys (1-5) - only when not in navigation mode and hearts unlocked
-            if not self.inventory.is_open and self.can_use_hearts:
-                if keys[pygame.K_1] and self.inventory_toggle_cooldown <= 0:
-                    self.inventory.highlight_slot(0)
-                    print("Highlighted slot 1")
-                    self.inventory_toggle_cooldown = 5
-                elif keys[pygame.K_2] and self.inventory_toggle_cooldown <= 0:
-                    self.inventory.highlight_slot(1)
-                    print("Highlighted slot 2")
-                    self.inventory_toggle_cooldown = 5
-                elif keys[pygame.K_3] and self.inventory_toggle_cooldown <= 0:
-                    self.inventory.highlight_slot(2)
-                    print("Highlighted slot 3")
-                    self.inventory_toggle_cooldown = 5
-                elif keys[pygame.K_4] and self.inventory_toggle_cooldown <= 0:
-                    self.inventory.highlight_slot(3)
-                    print("Highlighted slot 4")
-                    self.inventory_toggle_cooldown = 5
-                elif keys[pygame.K_5] and self.inventory_toggle_cooldown <= 0:
-                    self.inventory.highlight_slot(4)
-                    print("Highlighted slot 5")
-                    self.inventory_toggle_cooldown = 5
+            if not self.inventory.is_open and self.can_use_hearts and pressed_keys:
+                for slot, key in enumerate(_SLOT_KEYS):
+                    if key in pressed_keys:
+                        self.inventory.highlight_slot(slot)
+                        if DEBUG:
+                            print(f"Highlighted slot {slot + 1}")
+                        break
             
         # Inventory navigation when open (works even when movement is disabled)
         if self.inventory.is_open:
             # Exit inventory navigation (U key)
-            if keys[pygame.K_u] and self.inventory_toggle_cooldown <= 0:
+            if k_u:
                 self.inventory.is_open = False
-                print("Exited inventory navigation mode")
-                self.inventory_toggle_cooldown = 5  # 5 frames cooldown
+                if DEBUG:
+                    print("Exited inventory navigation mode")
             
-            if keys[pygame.K_LEFT] and self.inventory_toggle_cooldown <= 0:
+            if _K_LEFT in pressed_keys:
                 self.inventory.select_previous_slot()
-                self.inventory_toggle_cooldown = 5
-            elif keys[pygame.K_RIGHT] and self.inventory_toggle_cooldown <= 0:
+            elif _K_RIGHT in pressed_keys:
                 self.inventory.select_next_slot()
-                self.inventory_toggle_cooldown = 5
-            elif keys[pygame.K_w] and self.heart_use_cooldown <= 0 and self.can_use_hearts:
+            elif k_w and self.can_use_hearts:
                 self.use_selected_item()
-                self.heart_use_cooldown = 10
+                k_w = False  # This press is spent on the selected item
         
         # Use highlighted item with W key (works in both modes) - only if hearts unlocked
-        if keys[pygame.K_w] and self.heart_use_cooldown <= 0 and self.can_use_hearts:
+        if k_w and self.can_use_hearts:
             self.use_highlighted_item()
-            self.heart_use_cooldown = 10
-        elif keys[pygame.K_w] and not self.can_use_hearts:
-            print("Hearts not yet unlocked! Die to progress the story...")
+        elif k_w and not self.can_use_hearts:
+            if DEBUG:
+                print("Hearts not yet unlocked! Die to progress the story...")
 
         self.vel_y += GRAVITY
         dy = self.vel_y
-        current_bottom = self.rect.bottom
 
         if self.attacking:
-            # Different attack speeds for different weapons
-            if self.current_weapon == 'sword':
-                self.attack_index += 0.2
-                if self.attack_index >= len(self.current_attack_frames_right):
-                    self.attacking = False
-                    self.attack_index = 0
-                current_frame = self.current_attack_frames_right[int(self.attack_index)] if self.facing_right else self.current_attack_frames_left[int(self.attack_index)]
-                
-                # Check for sword attack collisions with enemies
+            # Sword and bow share the same animation timing; only the hit check differs
+            self.attack_index += 0.2
+            if self.attack_index >= self._attack_count:
+                self.attacking = False
+                self.attack_index = 0
+            current_frame = self._attack_frames[self.facing_right][int(self.attack_index)]
+            
+            # Check for sword attack collisions with enemies once, on the impact frame
+            if self.current_weapon == 'sword' and not self._attack_hit_done and int(self.attack_index) == _SWORD_IMPACT_FRAME:
                 self.check_attack_collision(enemy_sprites)
-            else:
-                # For ranged weapons, use full animation
-                self.attack_index += 0.2
-                if self.attack_index >= len(self.current_attack_frames_right):
-                    self.attacking = False
-                    self.attack_index = 0
-                current_frame = self.current_attack_frames_right[int(self.attack_index)] if self.facing_right else self.current_attack_frames_left[int(self.attack_index)]
+                self._attack_hit_done = True
 
         elif self.walking and self.on_ground:
             self.index += 0.2
-            if self.index >= len(self.walk_frames_right):
+            if self.index >= self._walk_count:
                 self.index = 0
-            current_frame = self.walk_frames_right[int(self.index)] if self.facing_right else self.walk_frames_left[int(self.index)]
+            current_frame = self._walk_frames[self.facing_right][int(self.index)]
 
         else:
             self.index = 0
-            current_frame = self.walk_frames_right[int(self.index)] if self.facing_right else self.walk_frames_left[int(self.index)]
+            current_frame = self._walk_frames[self.facing_right][0]
 
-        old_centerx = self.rect.centerx
-        self.image = current_frame
-        self.rect = self.image.get_rect(midbottom=(old_centerx, current_bottom))
+        # Only swap the frame when it changed, and keep the rect anchored at midbottom in place
+        if current_frame is not self.image:
+            self.image = current_frame
+            frame_size = current_frame.get_size()
+            if self.rect.size != frame_size:
+                midbottom = self.rect.midbottom
+                self.rect.size = frame_size
+                self.rect.midbottom = midbottom
         
         # Update collision box position to match player position
-        self.collision_rect.centerx = self.rect.centerx
-        self.collision_rect.bottom = self.rect.bottom
+        self.collision_rect.midbottom = self.rect.midbottom
 
-        # Store original position for collision detection
-        old_rect = self.rect.copy()
-        
         # Horizontal movement with perfect collision detection
         if dx != 0:
             # Check horizontal collision before moving
@@ -328,12 +349,8 @@ class Player(pygame.sprite.Sprite):
                 self.rect.centerx += dx
         
         # Prevent player from going outside map boundaries
-        # Map is 100 tiles wide (3200 pixels), so boundaries are 0 to 3200
-        # Player collision box is 24px wide, so keep player center within bounds
-        if self.rect.centerx < 12:  # Half collision box width from left edge
-            self.rect.centerx = 12
-        elif self.rect.centerx > 3200 - 12:  # Half collision box width from right edge
-            self.rect.centerx = 3200 - 12
+        # Keep the player center within the map bounds
+        self.rect.centerx = max(_MAP_LEFT_BOUND, min(_MAP_RIGHT_BOUND, self.rect.centerx))
 
         # Vertical movement with perfect collision detection
         if dy != 0:
@@ -396,16 +413,15 @@ class Player(pygame.sprite.Sprite):
             bar_x = 10
             bar_y = 10
             
-            pygame.draw.rect(screen, (255, 0, 0), (bar_x, bar_y, bar_width, bar_height))
+            # Solid rects: Surface.fill is a plain memset, cheaper than pygame.draw.rect
+            screen.fill((255, 0, 0), (bar_x, bar_y, bar_width, bar_height))
             
             # Health bar
             health_width = (self.health / self.max_health) * bar_width
-            pygame.draw.rect(screen, (0, 255, 0), (bar_x, bar_y, health_width, bar_height))
+            screen.fill((0, 255, 0), (bar_x, bar_y, health_width, bar_height))
             
-            # Health text
-            font = pygame.font.Font(None, 24)
-            health_text = font.render(f"Health: {self.health}/{self.max_health}", True, (255, 255, 255))
-            screen.blit(health_text, (bar_x, bar_y + 25))
+            # Health text (rendered once per distinct health value)
+            screen.blit(_health_text(self.health, self.max_health), (bar_x, bar_y + 25))
     
     def get_current_weapon(self):
         """Get the current weapon type"""
@@ -493,20 +509,25 @@ class Player(pygame.sprite.Sprite):
     
     def sync_inventory_from_story_progress(self):
         """Sync inventory with story progress file (for real-time updates)"""
+        self._ensure_inventory_loaded()
         if self.can_use_hearts:
+            # Skip the reload entirely while the save file is unchanged; size is compared too
+            # because coarse filesystem timestamps can miss a second write within the same tick
+            try:
+                st = os.stat(self.story_progression.save_file)
+                signature = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                signature = None
+            if signature is not None and signature == self._last_progress_stat:
+                return
+            self._last_progress_stat = signature
+
             # Reload story progression to get latest data
             self.story_progression.load_progress()
             
-            # Get current inventory from story progress
-            saved_inventory = self.story_progression.load_inventory()
+            # Get current heart count from story progress
+            saved_hearts = self.story_progression.get_inventory_counts().get('heart', 0)
             current_hearts = self.inventory.get_item_quantity('heart')
-            saved_hearts = 0
-            
-            # Count hearts in saved inventory
-            for item in saved_inventory:
-                if item.get('type') == 'heart':
-                    saved_hearts = item.get('quantity', 0)
-                    break
             
             # Update inventory if there's a difference
             if saved_hearts != current_hearts:
@@ -4,6 +4,14 @@ import math
 from .enemy_base import BaseEnemy
 from .animation import load_enemy_animations
 
+# Tile IDs slimes treat as solid when deciding to climb (same as in map_loader.py)
+SOLID_TILES = frozenset({1, 2, 3, 11, 12, 13, 21, 22, 23, 31, 34, 61, 62, 63, 64})
+
+# Byte lookup table over tile IDs (1 = solid), indexed directly instead of hashing into the set
+_SOLID_LUT = bytes(1 if tile_id in SOLID_TILES else 0 for tile_id in range(4096))
+_SOLID_LUT_SIZE = len(_SOLID_LUT)
+
+
 class SlimeEnemy(BaseEnemy):
     """Slime enemy with specific behaviors and animations"""
     
@@ -22,6 +30,14 @@ class SlimeEnemy(BaseEnemy):
         self.rect.centerx = x
         self.rect.bottom = y
         
+        # Sub-pixel center; Rect rounds every assignment, which would stall slow, diagonal steps
+        self._fx = float(self.rect.centerx)
+        self._fy = float(self.rect.centery)
+        self._float_synced = self.rect.center  # Rect center the floats were last written to
+        
+        # Waypoints never change after spawn, so count them once for the patrol wrap-around
+        self._waypoint_count = len(self.waypoints)
+        
         # Attack properties
         self.attack_range = 60  # Increased range for melee attack
         self.attack_damage = 2  # Reduced damage for melee
@@ -116,17 +132,12 @@ class SlimeEnemy(BaseEnemy):
     
     def check_height_and_climb(self, level):
         """Check for height differences and climb if needed"""
-        if not self.is_alive or not level.map_loader.map_data:
+        ground_layer = level.map_loader.ground_layer
+        if not self.is_alive or ground_layer is None:
             return
             
-        # Get map data
-        tile_width = level.map_loader.map_data.get('tilewidth', 32)
-        tile_height = level.map_loader.map_data.get('tileheight', 32)
-        map_width = level.map_loader.map_data.get('width', 0)
-        map_height = level.map_loader.map_data.get('height', 0)
-        
-        if map_width == 0 or map_height == 0:
-            return
+        # Map geometry and first-layer tile data, cached when the map loaded
+        tile_width, tile_height, map_width, map_height, layer_data = ground_layer
             
         # Convert slime position to tile coordinates
         slime_tile_x = int(self.rect.centerx // tile_width)
@@ -140,37 +151,31 @@ class SlimeEnemy(BaseEnemy):
         if check_tile_x < 0 or check_tile_x >= map_width or slime_tile_y < 0 or slime_tile_y >= map_height:
             return
             
-        # Get tile data from the first layer
-        if 'layers' in level.map_loader.map_data and len(level.map_loader.map_data['layers']) > 0:
-            layer_data = level.map_loader.map_data['layers'][0].get('data', [])
+        # Check for solid tiles in front of slime
+        front_tile_index = slime_tile_y * map_width + check_tile_x
+        if 0 <= front_tile_index < len(layer_data):
+            front_tile_id = layer_data[front_tile_index]
             
-            # Check for solid tiles in front of slime
-            front_tile_index = slime_tile_y * map_width + check_tile_x
-            if 0 <= front_tile_index < len(layer_data):
-                front_tile_id = layer_data[front_tile_index]
-                
-                # Define solid tiles (same as in map_loader.py)
-                solid_tiles = {1, 2, 3, 11, 12, 13, 21, 22, 23, 31, 34, 61, 62, 63, 64}
-                
-                if front_tile_id in solid_tiles:
-                    # There's a solid tile in front, try to climb up
-                    if self.moving and self.current_state == 'walk':
-                        # Check if there's space above the slime to climb
-                        current_tile_index = slime_tile_y * map_width + slime_tile_x
-                        if 0 <= current_tile_index < len(layer_data):
-                            current_tile_id = layer_data[current_tile_index]
+            if front_tile_id < _SOLID_LUT_SIZE and _SOLID_LUT[front_tile_id]:
+                # There's a solid tile in front, try to climb up
+                if self.moving and self.current_state == 'walk':
+                    # Check if there's space above the slime to climb
+                    current_tile_index = slime_tile_y * map_width + slime_tile_x
+                    if 0 <= current_tile_index < len(layer_data):
+                        current_tile_id = layer_data[current_tile_index]
+                        
+                        # If current tile is solid, try to move up
+                        if current_tile_id < _SOLID_LUT_SIZE and _SOLID_LUT[current_tile_id]:
+                            # Small upward movement to climb
+                            self.rect.y -= 2
                             
-                            # If current tile is solid, try to move up
-                            if current_tile_id in solid_tiles:
-                                # Small upward movement to climb
-                                self.rect.y -= 2
-                                
-                                # Also try to move forward slightly to get over the obstacle
-                                self.rect.x += direction * 2
+                            # Also try to move forward slightly to get over the obstacle
+                            self.rect.x += direction * 2
     
     def move_toward_player(self, player, collision_sprites):
         """Move toward the player when in range - with Y boundary check"""
-        dx = player.rect.centerx - self.rect.centerx
+        rect = self.rect
+        dx = player.rect.centerx - rect.centerx
         horizontal_distance = abs(dx)
         
         min_distance = 80
@@ -178,69 +183,74 @@ class SlimeEnemy(BaseEnemy):
         if horizontal_distance > min_distance:
             chase_speed = self.speed * 2.5
             dx = (dx / horizontal_distance) * chase_speed
-            
-            old_x = self.rect.centerx
-            old_y = self.rect.centery
-            
-            self.rect.centerx += dx
-            
-            # Y boundary check - don't go below 545
-            if self.rect.bottom > 545:
-                self.rect.bottom = 545
-            
-            # Check collision with walls
-            for sprite in collision_sprites:
-                if self.rect.colliderect(sprite.rect):
-                    self.rect.centerx = old_x
-                    self.rect.centery = old_y
-                    break
+            self._move(dx, 0, collision_sprites)
     
     def move_between_waypoints(self, collision_sprites):
         """Move between waypoints when player is not in range - with Y boundary check"""
-        if not self.waypoints or len(self.waypoints) <= 1:
+        waypoint_count = self._waypoint_count
+        if waypoint_count <= 1:
             return
             
-        # Check if reached current waypoint
-        distance_to_target = math.sqrt(
-            (self.rect.centerx - self.target_waypoint[0]) ** 2 + 
-            (self.rect.centery - self.target_waypoint[1]) ** 2
-        )
+        rect = self.rect
+        target_x, target_y = self.target_waypoint
+        dx = target_x - rect.centerx
+        dy = target_y - rect.centery
         
-        if distance_to_target < 10:  # Close enough to waypoint
-            self.current_waypoint_index = (self.current_waypoint_index + 1) % len(self.waypoints)
+        # Check if reached current waypoint (squared distance, no sqrt needed)
+        if dx * dx + dy * dy < 100:  # Within 10px: close enough to waypoint
+            self.current_waypoint_index = (self.current_waypoint_index + 1) % waypoint_count
             self.target_waypoint = self.waypoints[self.current_waypoint_index]
+            target_x, target_y = self.target_waypoint
+            dx = target_x - rect.centerx
+            dy = target_y - rect.centery
         
         # Move toward target waypoint
-        dx = self.target_waypoint[0] - self.rect.centerx
-        dy = self.target_waypoint[1] - self.rect.centery
-        distance = math.sqrt(dx ** 2 + dy ** 2)
+        distance = math.hypot(dx, dy)
         
         if distance > 0:
-            dx = (dx / distance) * self.speed
-            dy = (dy / distance) * self.speed
-            
-            old_x = self.rect.centerx
-            old_y = self.rect.centery
-            
-            self.rect.centerx += dx
-            self.rect.centery += dy
-            
-            # Y boundary check - don't go below 545
-            if self.rect.bottom > 545:
-                self.rect.bottom = 545
-            
-            # Check collision with walls
-            for sprite in collision_sprites:
-                if self.rect.colliderect(sprite.rect):
-                    self.rect.centerx = old_x
-                    self.rect.centery = old_y
-                    break
+            # One division, then scale both axes by the same factor
+            step = self.speed / distance
+            dx *= step
+            dy *= step
+            self._move(dx, dy, collision_sprites)
+    
+    def _move(self, dx, dy, collision_sprites):
+        """Step by a float offset from the sub-pixel position, with Y boundary and wall checks"""
+        rect = self.rect
+        # Something else (attack lunge, climbing) moved the rect: restart from where it is now
+        if rect.center != self._float_synced:
+            self._fx = float(rect.centerx)
+            self._fy = float(rect.centery)
+        
+        old_center = rect.center
+        fx = self._fx + dx
+        fy = self._fy + dy
+        rect.centerx = fx
+        rect.centery = fy
+        
+        # Y boundary check - don't go below 545
+        if rect.bottom > 545:
+            rect.bottom = 545
+            fy = float(rect.centery)
+        
+        # Check collision with walls (only tiles in nearby grid cells)
+        if collision_sprites.first_hit(rect) is not None:
+            rect.center = old_center
+        else:
+            self._fx = fx
+            self._fy = fy
+        self._float_synced = rect.center
 
     def update(self, player, collision_sprites, level=None):
         """Update slime with custom logic"""
         if not self.is_alive:
             self.handle_death_state()
             return
+        
+        # Far off-screen slimes only keep time; AI, movement and animation wait until they are near
+        if level is not None and not self.rect.colliderect(level.camera_cull_rect):
+            self.state_timer += 1
+            return
             
         # Update cooldowns
         if self.attack_cooldown > 0:
@@ -252,23 +262,23 @@ class SlimeEnemy(BaseEnemy):
             if self.attack_timer >= self.attack_duration:
                 self.is_attacking = False
                 self.set_state('idle')
-                self.animation_manager.set_animation('idle', loop=True)
             
             # During attack, move towards player
             if self.player_in_range:
-                dx = player.rect.centerx - self.rect.centerx
+                rect = self.rect
+                dx = player.rect.centerx - rect.centerx
                 if abs(dx) > 5:  # Only move if not too close
                     move_speed = self.speed * 1.5  # Faster during attack
                     if dx > 0:
-                        self.rect.x += move_speed
+                        rect.x += move_speed
                         self.facing_right = True
                     else:
-                        self.rect.x -= move_speed
+                        rect.x -= move_speed
                         self.facing_right = False
                 
                 # Y boundary check - don't go below 545
-                if self.rect.bottom > 545:
-                    self.rect.bottom = 545
+                if rect.bottom > 545:
+                    rect.bottom = 545
         else:
             # Check player detection
             self.check_player_detection(player)
@@ -279,12 +289,6 @@ class SlimeEnemy(BaseEnemy):
             # Check for height differences and climb (if level is provided)
             if level:
                 self.check_height_and_climb(level)
-            
-            # Update animation based on state
-            if self.current_state == 'walk' and not self.is_attacking:
-                self.animation_manager.set_animation('walk', loop=True)
-            elif self.current_state == 'idle' and not self.is_attacking:
-                self.animation_manager.set_animation('idle', loop=True)
         
         # Update animation
         self.animation_manager.update()
@@ -0,0 +1,11 @@
+import pygame
+
+# Default-font instances keyed by point size, loaded on first use and shared by every module
+_FONTS = {}
+
+def get_font(size):
+    """Return the default font at the given size, loading each size only once per process"""
+    font = _FONTS.get(size)
+    if font is None:
+        font = _FONTS[size] = pygame.font.Font(None, size)
+    return font
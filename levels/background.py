@@ -1,11 +1,45 @@
 import pygame
 import os
+import sys
+import numpy as np
 from config import WIDTH, HEIGHT
 
+def prescaled_path(image_path, scale_factor):
+    """Path of the pre-scaled copy of a layer image written by prescale_backgrounds.py"""
+    return f"{image_path[:-4]}.scaled-{scale_factor}.png"
+
+
+def _is_layer_file(filename):
+    """Original layer images only; pre-scaled copies are picked up per layer"""
+    return filename.endswith('.png') and '.scaled-' not in filename
+
+
+# Back layers slower than this scroll so little that they are composited into one cached surface
+STATIC_PARALLAX_THRESHOLD = 0.06
+
+
+def _extract_layer_number(filename):
+    """Sort key for standard layer files: Layer_0010_1 (farthest) first, Layer_0011_0 (ground) last"""
+    # Standard names are "Layer_NNNN_...png", so the layer number is always filename[6:10]
+    digits = filename[6:10]
+    if not (filename.startswith('Layer_') and digits.isdigit()):
+        return 999
+    layer_num = int(digits)
+    # Special case: Layer_0011_0 should be last (ground level)
+    if layer_num == 11:
+        return 1  # Put it after all others
+    # Reverse the order so 10 comes first, then 9, 8, etc.
+    return -layer_num
+
+
 class BackgroundLayer:
     """Represents a single background layer with parallax scrolling"""
     
-    def __init__(self, image_path, parallax_factor=1.0, y_offset=0, scale_factor=1.0):
+    __slots__ = ('image_path', 'prescaled', 'image', 'parallax_factor', 'y_offset', 'scale_factor',
+                 'scaled_width', 'scaled_height', 'use_alpha', 'tiled_image', 'blit_source', 'atlas_rect',
+                 '_centered', '_y_base', '_last_camera_offset', '_last_blit_position')
+    
+    def __init__(self, image_path, parallax_factor=1.0, y_offset=0, scale_factor=1.0, use_alpha=None):
         """
         Initialize a background layer
         
@@ -14,8 +48,14 @@ class BackgroundLayer:
             parallax_factor: How much this layer moves relative to camera (0.0 = fixed, 1.0 = moves with camera)
             y_offset: Vertical offset for positioning the layer
             scale_factor: Scale factor for the image (1.0 = original size)
+            use_alpha: Keep per-pixel alpha (None = only if the image has transparent pixels)
         """
-        self.image = pygame.image.load(image_path)
+        self.image_path = image_path
+        
+        # Prefer a copy already scaled offline so load skips transform.scale
+        scaled_path = prescaled_path(image_path, scale_factor)
+        self.prescaled = scale_factor != 1.0 and os.path.exists(scaled_path)
+        self.image = pygame.image.load(scaled_path if self.prescaled else image_path)
         # Convert to alpha format only if pygame display is initialized
         try:
             self.image = self.image.convert_alpha()
@@ -23,6 +63,17 @@ class BackgroundLayer:
             # If convert_alpha fails, just use the loaded image as-is
             pass
         
+        # Fully opaque layers (the sky) drop alpha so their blits are straight copies
+        if use_alpha is None:
+            width, height = self.image.get_size()
+            use_alpha = pygame.mask.from_surface(self.image, 254).count() < width * height
+        self.use_alpha = use_alpha
+        if not use_alpha:
+            try:
+                self.image = self.image.convert()
+            except pygame.error:
+                pass
+        
         self.parallax_factor = parallax_factor
         self.y_offset = y_offset
         self.scale_factor = scale_factor
@@ -33,7 +84,7 @@ class BackgroundLayer:
     def scale_image(self):
         """Scale the image based on scale factor and screen dimensions"""
         # Apply the scale factor first
-        if self.scale_factor != 1.0:
+        if self.scale_factor != 1.0 and not self.prescaled:
             original_width = self.image.get_width()
             original_height = self.image.get_height()
             new_width = int(original_width * self.scale_factor)
@@ -43,6 +94,33 @@ class BackgroundLayer:
         # Store dimensions
         self.scaled_width = self.image.get_width()
         self.scaled_height = self.image.get_height()
+        
+        # Pre-tile the image into one strip wide enough to cover the screen from any scroll
+        # position (plus the copy to the left), so draw is a single blit
+        copies = WIDTH // self.scaled_width + 2
+        strip_size = (copies * self.scaled_width, self.scaled_height)
+        try:
+            if self.use_alpha:
+                self.tiled_image = pygame.Surface(strip_size, pygame.SRCALPHA).convert_alpha()
+            else:
+                self.tiled_image = pygame.Surface(strip_size).convert()
+        except pygame.error:
+            self.tiled_image = pygame.Surface(strip_size, pygame.SRCALPHA if self.use_alpha else 0)
+        self.tiled_image.blits([(self.image, (i * self.scaled_width, 0)) for i in range(copies)], doreturn=0)
+        # Surface and area batched draws read the strip from (moved into the atlas once packed)
+        self.blit_source = self.tiled_image
+        self.atlas_rect = None
+        
+        # Layers shorter than the screen are centred vertically; taller ones are pinned to the top
+        self._centered = self.scaled_height < HEIGHT
+        if self._centered:
+            self._y_base = (HEIGHT - self.scaled_height) // 2 + self.y_offset
+        else:
+            self._y_base = self.y_offset
+        
+        # Last camera offset seen by blit_position and the strip position it produced
+        self._last_camera_offset = None
+        self._last_blit_position = None
     
     def draw(self, screen, camera_offset):
         """
@@ -52,42 +130,34 @@ class BackgroundLayer:
             screen: Pygame screen surface
             camera_offset: Camera position (x, y)
         """
+        screen.blit(self.tiled_image, self.blit_position(camera_offset))
+    
+    def blit_position(self, camera_offset):
+        """Return where the pre-tiled strip goes on screen for this camera offset"""
+        # The camera often holds still (idle player, clamped at a map edge): reuse the last result
+        if camera_offset == self._last_camera_offset:
+            return self._last_blit_position
+        
+        factor = self.parallax_factor
+        width = self.scaled_width
+        
         # Calculate parallax offset
-        parallax_x = camera_offset[0] * self.parallax_factor
-        parallax_y = camera_offset[1] * self.parallax_factor
+        parallax_x = camera_offset[0] * factor
+        parallax_y = camera_offset[1] * factor
         
         # Calculate drawing position
-        draw_x = int(-parallax_x % self.scaled_width)
-        draw_y = int(self.y_offset - parallax_y)
+        draw_x = int(-parallax_x % width)
+        draw_y = int(self._y_base - parallax_y)
         
-        # Ensure the layer covers the full screen height
-        if self.scaled_height < HEIGHT:
-            # Center vertically if smaller than screen
-            draw_y = int((HEIGHT - self.scaled_height) // 2 + self.y_offset - parallax_y)
-        else:
-            # Start from top if larger than screen
-            if draw_y > 0:
-                draw_y = 0
-        
-        # Draw the main image
-        screen.blit(self.image, (draw_x, draw_y))
-        
-        # Draw additional copies for seamless horizontal scrolling
-        if self.scaled_width < WIDTH:
-            # Calculate how many copies we need
-            copies_needed = int(WIDTH / self.scaled_width) + 2
-            for i in range(1, copies_needed):
-                x_pos = draw_x + (i * self.scaled_width)
-                if x_pos < WIDTH:  # Only draw if visible
-                    screen.blit(self.image, (x_pos, draw_y))
-        
-        # Draw copies to the left for seamless scrolling
-        if draw_x > 0:
-            copies_left = int(draw_x / self.scaled_width) + 1
-            for i in range(1, copies_left + 1):
-                x_pos = draw_x - (i * self.scaled_width)
-                if x_pos > -self.scaled_width:  # Only draw if partially visible
-                    screen.blit(self.image, (x_pos, draw_y))
+        # Layers taller than the screen never leave a gap above them
+        if draw_y > 0 and not self._centered:
+            draw_y = 0
+        
+        # The strip starts one copy left of the scrolled image
+        position = (draw_x - width, draw_y)
+        self._last_camera_offset = tuple(camera_offset)
+        self._last_blit_position = position
+        return position
 
 class LayeredBackground:
     """Manages multiple background layers with different parallax effects"""
@@ -105,6 +175,20 @@ class LayeredBackground:
         self.background_folder = background_folder
         self.simple_background = simple_background
         self.background_color = background_color
+        self._fill_color_cache = None  # Sampled sky color; layer pixels never change once loaded
+        self.sky_surface = None  # Screen-sized surface pre-filled with the sky color, built on first clear
+        
+        # Slow back layers are drawn through one cached composite, rebuilt only when one of them moves
+        self.static_layers = []
+        self.dynamic_layers = []
+        self.static_composite = None
+        self._static_positions = None
+        self.atlas = None  # Every layer's strip packed into one surface, see build_atlas
+        self.build_parallax_arrays()
+        
+        # The last fully drawn background frame and the camera offset it was drawn for
+        self.frame_cache = None
+        self._frame_offset = None
         
         if not simple_background:
             self.load_background_layers()
@@ -117,36 +201,105 @@ class LayeredBackground:
         
         # Clear existing layers
         self.layers = []
+        self._fill_color_cache = None
+        self.sky_surface = None
+        self.frame_cache = None
+        self._frame_offset = None
         
         # Get all PNG files in the background folder
-        image_files = [f for f in os.listdir(self.background_folder) if f.endswith('.png')]
+        image_files = [f for f in os.listdir(self.background_folder) if _is_layer_file(f)]
         
         # Check if this is the Futuristic City Parallax folder
         if "Futuristic City Parallax" in self.background_folder:
             self.load_futuristic_city_layers(image_files)
         else:
             self.load_standard_layers(image_files)
+        
+        self.split_static_layers()
+        self.build_atlas()
+        self.build_parallax_arrays()
+    
+    def build_atlas(self):
+        """Pack every transparent layer's tiled strip into one vertical atlas surface
+        
+        Each packed layer keeps a subsurface view of its strip for single
+        blits, and the batched draws pass (atlas, position, atlas_rect) so
+        those layers come from the same source surface. Opaque layers keep
+        their own strip so they still blit without alpha.
+        """
+        self.atlas = None
+        packed = [layer for layer in self.layers if layer.use_alpha]
+        if not packed:
+            return
+        
+        width = max(layer.tiled_image.get_width() for layer in packed)
+        height = sum(layer.tiled_image.get_height() for layer in packed)
+        atlas = pygame.Surface((width, height), pygame.SRCALPHA)
+        try:
+            atlas = atlas.convert_alpha()
+        except pygame.error:
+            pass
+        
+        y = 0
+        for layer in packed:
+            strip = layer.tiled_image
+            rect = pygame.Rect(0, y, strip.get_width(), strip.get_height())
+            atlas.blit(strip, rect)
+            layer.atlas_rect = rect
+            layer.blit_source = atlas
+            layer.tiled_image = atlas.subsurface(rect)
+            y += rect.height
+        self.atlas = atlas
+    
+    def build_parallax_arrays(self):
+        """Gather the per-frame layers' parallax inputs into arrays for dynamic_positions"""
+        layers = self.dynamic_layers
+        self._factors = np.array([layer.parallax_factor for layer in layers], dtype=np.float64)
+        self._widths = np.array([layer.scaled_width for layer in layers], dtype=np.int64)
+        self._y_bases = np.array([layer._y_base for layer in layers], dtype=np.float64)
+        self._clamp_top = np.array([not layer._centered for layer in layers], dtype=bool)
+        self._dynamic_sources = [layer.blit_source for layer in layers]
+        self._dynamic_areas = [layer.atlas_rect for layer in layers]
+        self._last_dynamic_offset = None
+        self._last_dynamic_positions = None
+    
+    def dynamic_positions(self, camera_offset):
+        """Strip positions of all per-frame layers, computed in one vectorized pass
+        
+        Matches BackgroundLayer.blit_position: float modulo for x and
+        truncation toward zero for y, so layers land on the same pixels.
+        """
+        if camera_offset == self._last_dynamic_offset:
+            return self._last_dynamic_positions
+        
+        cam_x, cam_y = camera_offset
+        factors = self._factors
+        widths = self._widths
+        draw_xs = np.mod(-(cam_x * factors), widths).astype(np.int64) - widths
+        draw_ys = (self._y_bases - cam_y * factors).astype(np.int64)
+        # Layers taller than the screen never leave a gap above them
+        draw_ys[self._clamp_top & (draw_ys > 0)] = 0
+        
+        positions = list(zip(draw_xs.tolist(), draw_ys.tolist()))
+        self._last_dynamic_offset = tuple(camera_offset)
+        self._last_dynamic_positions = positions
+        return positions
+    
+    def split_static_layers(self):
+        """Split the leading slow layers (back to front) from the ones redrawn every frame"""
+        split = 0
+        while split < len(self.layers) and self.layers[split].parallax_factor < STATIC_PARALLAX_THRESHOLD:
+            split += 1
+        self.static_layers = self.layers[:split]
+        self.dynamic_layers = self.layers[split:]
+        self.static_composite = None
+        self._static_positions = None
     
     def load_standard_layers(self, image_files):
         """Load standard background layers (original system)"""
         # Sort by the layer number in the filename
         # We want Layer_0010_1 first (farthest), then Layer_0009_2, etc.
-        def extract_layer_number(filename):
-            try:
-                # Extract number from filename like "Layer_0000_9.png" -> 0
-                parts = filename.replace('.png', '').split('_')
-                if len(parts) >= 2:
-                    layer_num = int(parts[1])  # Get the middle number
-                    # Special case: Layer_0011_0 should be last (ground level)
-                    if layer_num == 11:
-                        return 1  # Put it after all others
-                    # Reverse the order so 10 comes first, then 9, 8, etc.
-                    return -layer_num
-                return 999
-            except (ValueError, IndexError):
-                return 999
-        
-        image_files.sort(key=extract_layer_number)
+        image_files.sort(key=_extract_layer_number)
         
         print(f"🌙 Loading {len(image_files)} background layers...")
         
@@ -237,6 +390,8 @@ class LayeredBackground:
         """
         Draw all background layers in order (back to front) or simple colored background
         
+        Layered backgrounds are drawn as one opaque cached frame that covers the screen.
+        
         Args:
             screen: Pygame screen surface
             camera_offset: Camera position (x, y)
@@ -244,10 +399,80 @@ class LayeredBackground:
         if self.simple_background:
             # Draw simple colored background
             screen.fill(self.background_color)
+        elif self.layers:
+            # Reuse the last frame while the camera holds still; it already includes the fill color
+            frame = self.frame_cache
+            if frame is None or frame.get_size() != screen.get_size():
+                frame = pygame.Surface(screen.get_size())
+                try:
+                    frame = frame.convert()
+                except pygame.error:
+                    pass
+                self.frame_cache = frame
+                self._frame_offset = None
+            
+            if camera_offset != self._frame_offset:
+                self.render_layers(frame, camera_offset)
+                self._frame_offset = tuple(camera_offset)
+            screen.blit(frame, (0, 0))
+    
+    def render_layers(self, target, camera_offset):
+        """Draw the fill color and every layer (back to front) onto target"""
+        if self.static_layers:
+            self.draw_static_composite(target, camera_offset)
         else:
-            # Draw layers from back to front (distant to close)
-            for i, layer in enumerate(self.layers):
-                layer.draw(screen, camera_offset)
+            target.fill(self.get_background_fill_color())
+        
+        layers = self.dynamic_layers
+        if len(layers) == 1:
+            layers[0].draw(target, camera_offset)
+        elif layers:
+            # Draw layers from back to front (distant to close) in one batched call
+            target.blits(list(zip(self._dynamic_sources, self.dynamic_positions(camera_offset),
+                                  self._dynamic_areas)), doreturn=0)
+    
+    def draw_static_composite(self, screen, camera_offset):
+        """Blit the sky color and the slow back layers as one opaque surface
+        
+        The composite starts from the fill color, so it matches clearing the
+        screen and drawing those layers one by one. It is only re-rendered
+        when one of the slow layers has scrolled to a new pixel.
+        """
+        positions = tuple(layer.blit_position(camera_offset) for layer in self.static_layers)
+        composite = self.static_composite
+        if composite is None or composite.get_size() != screen.get_size():
+            composite = pygame.Surface(screen.get_size())
+            try:
+                composite = composite.convert()
+            except pygame.error:
+                pass
+            self.static_composite = composite
+            self._static_positions = None
+        
+        if positions != self._static_positions:
+            composite.fill(self.get_background_fill_color())
+            composite.blits([(layer.blit_source, position, layer.atlas_rect)
+                             for layer, position in zip(self.static_layers, positions)], doreturn=0)
+            self._static_positions = positions
+        
+        screen.blit(composite, (0, 0))
+    
+    def clear(self, screen):
+        """Clear the screen to the background fill color by blitting a persistent sky surface"""
+        # draw() already covers the whole screen (opaque cached frame or a fill), so only clear when it won't
+        if self.simple_background or self.layers:
+            return
+        
+        sky = self.sky_surface
+        if sky is None or sky.get_size() != screen.get_size():
+            sky = pygame.Surface(screen.get_size())
+            try:
+                sky = sky.convert()
+            except pygame.error:
+                pass
+            sky.fill(self.get_background_fill_color())
+            self.sky_surface = sky
+        screen.blit(sky, (0, 0))
     
     def get_layer_count(self):
         """Return the number of loaded background layers"""
@@ -266,6 +491,9 @@ class LayeredBackground:
         if self.simple_background:
             return self.background_color
         
+        if self._fill_color_cache is not None:
+            return self._fill_color_cache
+        
         if not self.layers:
             return (0, 0, 0)
         
@@ -279,26 +507,27 @@ class LayeredBackground:
         # Sample a few pixels across the top area to get a representative sky color
         sample_points = [
             (0, 0),
-            (max(0, width // 4), 0),
-            (max(0, width // 2), 0),
-            (max(0, (3 * width) // 4), 0),
-            (max(0, width - 1), 0),
-            (max(0, width // 2), min(10, height - 1)),
+            (width // 4, 0),
+            (width // 2, 0),
+            ((3 * width) // 4, 0),
+            (width - 1, 0),
+            (width // 2, min(10, height - 1)),
         ]
         
-        r_total = g_total = b_total = 0
-        count = 0
-        for x, y in sample_points:
-            try:
-                color = surface.get_at((int(x), int(y)))
-                r_total += int(color.r)
-                g_total += int(color.g)
-                b_total += int(color.b)
-                count += 1
-            except Exception:
-                continue
-        
-        if count == 0:
-            return (0, 0, 0)
+        if surface.get_bytesize() == 4:
+            # Read the packed pixels straight from the surface buffer instead of boxing a Color per get_at
+            pitch = surface.get_pitch()
+            pixels = memoryview(surface.get_buffer())
+            colors = [surface.unmap_rgb(int.from_bytes(pixels[y * pitch + x * 4:y * pitch + x * 4 + 4], sys.byteorder))
+                      for x, y in sample_points]
+            del pixels  # Release the surface lock
+        else:
+            colors = [surface.get_at(point) for point in sample_points]
+        
+        r_total = sum(color.r for color in colors)
+        g_total = sum(color.g for color in colors)
+        b_total = sum(color.b for color in colors)
+        count = len(colors)
         
-        return (r_total // count, g_total // count, b_total // count)
\ No newline at end of file
+        self._fill_color_cache = (r_total // count, g_total // count, b_total // count)
+        return self._fill_color_cache
\ No newline at end of file
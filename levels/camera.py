@@ -1,6 +1,10 @@
 import pygame
 from config import *
 
+# Camera easing per frame as an integer ratio (0.15), so update stays in integer pixels
+CAMERA_SPEED_NUM = 3
+CAMERA_SPEED_DEN = 20
+
 
 class Camera:
     def __init__(self, width, height):
@@ -12,30 +16,48 @@ class Camera:
         self.target_x = 0
         self.target_y = 0
         self.camera_speed = 0.1
+        
+        # Plain-int copy of camera.x for apply_xy, refreshed by update
+        self._cam_x = 0
 
     def apply(self, entity):
-        return entity.rect.move(self.camera.topleft)
+        # The camera never scrolls vertically (target_y is always 0), so only x is offset
+        return entity.rect.move(self.camera.x, 0)
+    
+    def apply_xy(self, entity):
+        """Screen (x, y) of an entity's top-left, without allocating a Rect"""
+        rect = entity.rect
+        return (rect.x + self._cam_x, rect.y)
     
     def apply_pos(self, pos):
         return (pos[0] + self.camera.x, pos[1] + self.camera.y)
 
     def update(self, target):
-        target_x = -target.rect.centerx + int(self.viewport_width / 2)
+        camera = self.camera
+        viewport_width = self.viewport_width
+        target_x = -target.rect.centerx + int(viewport_width / 2)
         target_y = 0
         
         map_width = 3200
         
         target_x = min(0, target_x)
-        target_x = max(target_x, -(map_width - self.viewport_width))
+        target_x = max(target_x, -(map_width - viewport_width))
         
         self.target_x = target_x
         self.target_y = target_y
         
-        current_x = self.camera.x
-        current_y = self.camera.y
+        current_x = camera.x
+        current_y = camera.y
         
-        camera_speed = 0.15
-        new_x = current_x + (self.target_x - current_x) * camera_speed
-        new_y = current_y + (self.target_y - current_y) * camera_speed
-        
-        self.camera = pygame.Rect(new_x, new_y, self.viewport_width, self.height)
+        # Move the existing Rect in place, truncating toward zero like the Rect constructor did
+        camera.x = _ease(current_x, target_x)
+        camera.y = _ease(current_y, target_y)
+        self._cam_x = camera.x
+
+
+def _ease(current, target):
+    """Step current toward target by CAMERA_SPEED_NUM / CAMERA_SPEED_DEN using integer math"""
+    scaled = current * CAMERA_SPEED_DEN + (target - current) * CAMERA_SPEED_NUM
+    if scaled >= 0:
+        return scaled // CAMERA_SPEED_DEN
+    return -(-scaled // CAMERA_SPEED_DEN)
@@ -0,0 +1,87 @@
+from collections import defaultdict
+from config import TILE_SIZE
+
+
+class CollisionGrid:
+    """Buckets collision sprites by grid cell so lookups only touch nearby tiles"""
+
+    def __init__(self, cell_size=TILE_SIZE):
+        self.cell_size = cell_size
+        self.sprites = []
+        self.rects = []
+        self.solid_cells = defaultdict(list)
+        self.platform_cells = defaultdict(list)
+
+    def rebuild(self, sprites):
+        """Re-bucket all sprites (call whenever level geometry changes)"""
+        self.sprites = list(sprites)
+        # Tile rects cached alongside the sprites so hit tests skip the .rect lookup
+        self.rects = [sprite.rect for sprite in self.sprites]
+        self.solid_cells = defaultdict(list)
+        self.platform_cells = defaultdict(list)
+
+        # Split one-way platforms from solid tiles once, so lookups never need hasattr
+        for index, sprite in enumerate(self.sprites):
+            cells = self.platform_cells if getattr(sprite, 'is_platform', False) else self.solid_cells
+            for key in self._cell_keys(sprite.rect):
+                cells[key].append(index)
+
+    def _cell_keys(self, rect):
+        """Yield the keys of every cell the rect touches"""
+        cell = self.cell_size
+        for cy in range(rect.top // cell, (rect.bottom - 1) // cell + 1):
+            for cx in range(rect.left // cell, (rect.right - 1) // cell + 1):
+                yield (cx, cy)
+
+    def _candidate_indices(self, rect, *cell_maps):
+        """Return the sorted (group-order) indices of sprites from the given cell maps sharing a cell with rect"""
+        found = set()
+        for key in self._cell_keys(rect):
+            for cells in cell_maps:
+                bucket = cells.get(key)
+                if bucket:
+                    found.update(bucket)
+        return sorted(found)
+
+    def _query(self, rect, *cell_maps):
+        """Return sprites from the given cell maps near rect, in their original group order"""
+        sprites = self.sprites
+        return [sprites[index] for index in self._candidate_indices(rect, *cell_maps)]
+
+    def overlapping(self, rect):
+        """Return all sprites sharing a cell with rect"""
+        return self._query(rect, self.solid_cells, self.platform_cells)
+
+    def _first_hit(self, rect, *cell_maps):
+        """Return the first sprite (in group order) from the given cell maps colliding with rect, or None"""
+        candidates = self._candidate_indices(rect, *cell_maps)
+        if not candidates:
+            return None
+
+        rects = self.rects
+        index = rect.collidelist([rects[i] for i in candidates])
+        if index == -1:
+            return None
+        return self.sprites[candidates[index]]
+
+    def first_hit(self, rect):
+        """Return the first sprite of any kind colliding with rect, or None"""
+        return self._first_hit(rect, self.solid_cells, self.platform_cells)
+
+    def first_solid_hit(self, rect):
+        """Return the first solid sprite colliding with rect, or None"""
+        return self._first_hit(rect, self.solid_cells)
+
+    def solids_near(self, rect):
+        """Return solid (non-platform) sprites sharing a cell with rect"""
+        return self._query(rect, self.solid_cells)
+
+    def platforms_near(self, rect):
+        """Return one-way platform sprites sharing a cell with rect"""
+        return self._query(rect, self.platform_cells)
+
+    def __iter__(self):
+        return iter(self.sprites)
+
+    def __len__(self):
+        return len(self.sprites)
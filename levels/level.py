@@ -1,16 +1,153 @@
 import pygame
+import string
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from config import *
 from entities.player import Player
 from entities.enemy import Enemy
 from entities.enemy_factory import EnemyFactory
+from entities.slime_enemy import SlimeEnemy
 from entities.bow import Bow
 from entities.arrow import Arrow
 from levels.tile import Tile
 from levels.camera import Camera
+from levels.collision_grid import CollisionGrid
 from levels.map_loader import MapLoader
 from story_progression import StoryProgression
-from api_client import get_api_client, APIError
+from fonts import get_font
+from api_client import get_api_client, get_worker_api_client, APIError
 
+# Worker thread for backend calls, so HTTP round-trips never stall a frame.
+# One worker keeps calls from successive Levels (e.g. an old save and a restart's init)
+# from ever using the shared worker API client at the same time.
+_api_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="level-api")
+
+def shutdown_api_pool():
+    """Cancel queued backend calls when quitting (a call already in flight still ends at its request timeout)"""
+    _api_pool.shutdown(wait=False, cancel_futures=True)
+
+# Rendered text surfaces keyed by (font, text, color), for fixed labels and small bounded sets of strings
+_TEXT_CACHE = {}
+
+def _render_text(font, text, color):
+    """Return font.render(text, True, color), rendering each combination only once"""
+    key = (font, text, color)
+    surface = _TEXT_CACHE.get(key)
+    if surface is None:
+        surface = _TEXT_CACHE[key] = font.render(text, True, color)
+    return surface
+
+def _render_outlined_text(font, text, color, outline_color, offset=2):
+    """Return text drawn over copies of itself shifted by offset in eight directions, composited once"""
+    key = (font, text, color, outline_color, offset)
+    surface = _TEXT_CACHE.get(key)
+    if surface is None:
+        text_surface = _render_text(font, text, color)
+        outline_surface = _render_text(font, text, outline_color)
+        width, height = text_surface.get_size()
+        surface = pygame.Surface((width + 2 * offset, height + 2 * offset), pygame.SRCALPHA)
+        for dx in (-offset, 0, offset):
+            for dy in (-offset, 0, offset):
+                if dx != 0 or dy != 0:
+                    surface.blit(outline_surface, (offset + dx, offset + dy))
+        surface.blit(text_surface, (offset, offset))
+        _TEXT_CACHE[key] = surface
+    return surface
+
+# Word-wrapped dialogue lines keyed by (text, font, max_width); dialogue text is fixed, so lines never go stale
+_WRAP_CACHE = {}
+
+# Per-font {character: width} tables, used to estimate how many words fit on a line
+_CHAR_WIDTHS = {}
+
+def _char_widths(font):
+    """Return the font's character width table, measuring printable ASCII up front"""
+    widths = _CHAR_WIDTHS.get(font)
+    if widths is None:
+        widths = _CHAR_WIDTHS[font] = {char: font.size(char)[0] for char in string.printable}
+    return widths
+
+def _wrap_text(text, font, max_width):
+    """Split text into lines narrower than max_width pixels, wrapping each text only once"""
+    key = (text, font, max_width)
+    lines = _WRAP_CACHE.get(key)
+    if lines is None:
+        widths = _char_widths(font)
+        words = text.split()
+        word_widths = []
+        for word in words:
+            width = 0
+            for char in word:
+                char_width = widths.get(char)
+                if char_width is None:
+                    char_width = widths[char] = font.size(char)[0]
+                width += char_width
+            word_widths.append(width)
+        space_width = widths[' ']
+        
+        lines = []
+        start = 0
+        while start < len(words):
+            # Guess how many words fit by summing character widths (kerning makes this approximate)
+            count = 1
+            width = word_widths[start]
+            while start + count < len(words) and width + space_width + word_widths[start + count] < max_width:
+                width += space_width + word_widths[start + count]
+                count += 1
+            
+            # Then measure: grow while the next word still fits, shrink while the line overflows.
+            # A word too wide on its own still gets a line to itself.
+            if font.size(" ".join(words[start:start + count]))[0] < max_width:
+                while start + count < len(words) and font.size(" ".join(words[start:start + count + 1]))[0] < max_width:
+                    count += 1
+            else:
+                while count > 1:
+                    count -= 1
+                    if font.size(" ".join(words[start:start + count]))[0] < max_width:
+                        break
+            
+            lines.append(" ".join(words[start:start + count]))
+            start += count
+        lines = _WRAP_CACHE[key] = tuple(lines)
+    return lines
+
+# Enemy tile IDs the player's sword can hit
+ATTACKABLE_TILE_IDS = frozenset({41, 42})
+
+# Distance in pixels (player center to tile center) that triggers an interaction prompt
+INTERACTION_DISTANCE = 50
+INTERACTION_DISTANCE_SQ = INTERACTION_DISTANCE * INTERACTION_DISTANCE
+
+# Dialogue lines styled as controls: titles in gold, the rest in light green
+INTRO_CONTROL_LINES = frozenset({"CONTROLS:", "Arrow Keys - Move Left/Right", "SPACE - Jump", "F - Attack with Sword"})
+STORY_CONTROL_LINES = frozenset({"HEART CONTROLS:", "BOW CONTROLS:", "I - Open/Close Inventory", "1-0 - Select Heart Slot",
+                                 "W - Use Selected Heart", "E - Switch Sword/Bow", "F - Fire Arrow (when bow selected)",
+                                 "Arrow Keys - Aim Direction"})
+CONTROL_TITLE_LINES = frozenset({"CONTROLS:", "HEART CONTROLS:", "BOW CONTROLS:"})
+
+# Sword hitbox (width, height): wider for sword length, shorter for sword width
+SWORD_HITBOX_SIZE = (80, 30)
+
+# Starting enemies as (spawn position, patrol waypoints) - 5 enemies in different areas.
+# Ground is from 0 to 96 pixels from bottom, so enemies spawn above it at Y 520.
+# Waypoint tuples are shared between levels; enemies only ever read them.
+ENEMY_SPAWN_TABLE = (
+    ((200, 520), ((200, 520), (300, 520), (400, 520), (300, 520))),  # Area 1: Left side
+    ((800, 520), ((800, 520), (900, 520), (1000, 520), (900, 520))),  # Area 2: Center-right
+    ((1400, 520), ((1400, 520), (1500, 520), (1600, 520), (1500, 520))),  # Area 3: Far right
+    ((600, 520), ((600, 520), (700, 520), (800, 520), (700, 520))),  # Area 4: Upper area
+    ((1200, 520), ((1200, 520), (1300, 520), (1400, 520), (1300, 520))),  # Area 5: Middle area
+)
+
+# Tile ID reported for positions outside the map (Tiled uses 0 for empty cells)
+OFF_MAP_TILE_ID = -1
+
+# Bits of Level.latched_keys: dialogue keys that already fired and must be released before firing again
+KEY_BIT_Z = 1
+KEY_BIT_ENTER = 2
+KEY_BIT_Q = 4
+KEY_BIT_R = 8
 
 
 class Level:
@@ -21,11 +158,14 @@ class Level:
         self.story_progression = StoryProgression()
         
         self.api_client = get_api_client()
+        self.worker_api_client = get_worker_api_client()  # Own HTTP session for calls made on _api_pool
         self.api_connected = False
         self.score_saved = False
         self.player_data_synced = False
         self.game_data_initialized = False
         self.player_progress = None
+        self.api_init_future = None  # Pending initialize_game_data call, see poll_api_tasks
+        self.save_future = None  # Pending save_game_session call
         
         self.currency_earned = 0
         self.currency_rule = None
@@ -33,7 +173,9 @@ class Level:
         self.visible_sprite = pygame.sprite.Group()
         self.active_sprite = pygame.sprite.Group()
         self.collision_sprite = pygame.sprite.Group()
+        self.collision_grid = CollisionGrid()
         self.enemy_sprite = pygame.sprite.Group()
+        self.attackable_enemy_tiles = []
         self.enemies = pygame.sprite.Group()
         self.enemy_projectiles = pygame.sprite.Group()
         self.hearts = pygame.sprite.Group()
@@ -66,6 +208,8 @@ class Level:
         
         # Camera system
         self.camera = Camera(WIDTH, HEIGHT)
+        # World-space view padded by ENEMY_CULL_MARGIN; slimes outside it skip their AI
+        self.camera_cull_rect = pygame.Rect(0, 0, WIDTH + 2 * ENEMY_CULL_MARGIN, HEIGHT + 2 * ENEMY_CULL_MARGIN)
         
         # Map loader
         self.map_loader = MapLoader()
@@ -77,10 +221,22 @@ class Level:
         self.transition_timer = 0
         self.transition_duration = 120  # 2 seconds at 60fps
         self.transition_progress = 0.0
+        self.debug_attack_hitbox = None  # Last sword hitbox, outlined when DEBUG_HITBOXES is on
+        self.attack_hitbox = pygame.Rect((0, 0), SWORD_HITBOX_SIZE)  # Repositioned each attack frame
+        self.attack_hit_targets = set()  # Enemies/objects already damaged by the current sword swing
+        self.transition_overlay = None  # Black fade surface, created on the first transition frame
+        self.stat_texts = {}  # slot -> ((font, text, color), surface) for end-screen values that change per run
+        self.end_screen_overlay = None  # Dimming overlay for the game over / win screens, created on first use
+        self.stats_panel = None  # Rounded stats panel background, created on the first draw_game_stats
+        self.transition_labels = {}  # map name -> (text, text_rect, bg_rect), rendered once
         self.sunrise_character = None  # Static character for sunrise
+        self.sunrise_pos = None  # World position of the sunrise character, set when the map loads
         
         # Interaction system
         self.interactive_tiles = []
+        # Interactive tile centers as parallel arrays, see build_interactive_arrays
+        self.interactive_xs = np.empty(0, dtype=np.int64)
+        self.interactive_ys = np.empty(0, dtype=np.int64)
         self.nearby_interactive = None
         self.show_interaction_prompt = False
         self.dialogue_active = False
@@ -93,11 +249,8 @@ class Level:
         self.story_dialogue_index = 0
         self.show_intro_dialogue = False
         
-        # Key state tracking for dialogue
-        self.z_pressed = False
-        self.enter_pressed = False
-        self.q_pressed = False
-        self.r_pressed = False
+        # Key state tracking for dialogue (KEY_BIT_* flags)
+        self.latched_keys = 0
         
         # Test dialogues
         self.dialogues = {
@@ -116,41 +269,58 @@ class Level:
         # Start timing
         self.start_time = pygame.time.get_ticks()
         
-        # Initialize all game data through API
-        self.initialize_game_data()
+        # Initialize all game data through API, off the main thread
+        self.api_init_future = _api_pool.submit(self.initialize_game_data)
     
-    def is_position_on_tile_id(self, x, y, tile_id):
-        """Check if a position is on a specific tile ID"""
-        if not self.map_loader.map_data:
-            return False
+    def tile_id_at(self, x, y):
+        """Return the first-layer tile ID at a world position, or OFF_MAP_TILE_ID outside the map"""
+        ground_layer = self.map_loader.ground_layer
+        if ground_layer is None:
+            return OFF_MAP_TILE_ID
         
-        tile_width = self.map_loader.map_data.get('tilewidth', 32)
-        tile_height = self.map_loader.map_data.get('tileheight', 32)
-        map_width = self.map_loader.map_data.get('width', 0)
+        # Map geometry and first-layer tile data, cached when the map loaded
+        tile_width, tile_height, map_width, map_height, layer_data = ground_layer
         
         # Convert world position to tile coordinates
         tile_x = int(x // tile_width)
         tile_y = int(y // tile_height)
         
         # Check if coordinates are within map bounds
-        if tile_x < 0 or tile_x >= map_width or tile_y < 0:
-            return False
-        
-        # Get the tile data from the first layer
-        if 'layers' in self.map_loader.map_data and len(self.map_loader.map_data['layers']) > 0:
-            layer_data = self.map_loader.map_data['layers'][0].get('data', [])
-            map_height = self.map_loader.map_data.get('height', 0)
-            
-            if tile_y >= map_height:
-                return False
-            
-            # Calculate index in the 1D array
-            index = tile_y * map_width + tile_x
-            
-            if 0 <= index < len(layer_data):
-                return layer_data[index] == tile_id
-        
-        return False
+        if tile_x < 0 or tile_x >= map_width or tile_y < 0 or tile_y >= map_height:
+            return OFF_MAP_TILE_ID
+        
+        # Calculate index in the 1D array
+        index = tile_y * map_width + tile_x
+        if index >= len(layer_data):
+            return OFF_MAP_TILE_ID
+        return layer_data[index]
+    
+    def tile_ids_at(self, xs, ys):
+        """Vectorized tile_id_at: one tile ID per (xs[i], ys[i]), OFF_MAP_TILE_ID outside the map"""
+        xs = np.asarray(xs).reshape(-1)
+        ys = np.asarray(ys).reshape(-1)
+        grid = self.map_loader.ground_grid
+        if grid is None:
+            return np.array([self.tile_id_at(x, y) for x, y in zip(xs, ys)], dtype=np.int64)
+        
+        tile_width, tile_height, map_width, map_height, _ = self.map_loader.ground_layer
+        tile_xs = (xs // tile_width).astype(np.int64)
+        tile_ys = (ys // tile_height).astype(np.int64)
+        
+        # Positions outside the map keep the off-map marker
+        inside = (tile_xs >= 0) & (tile_xs < map_width) & (tile_ys >= 0) & (tile_ys < map_height)
+        ids = np.full(len(xs), OFF_MAP_TILE_ID, dtype=np.int64)
+        ids[inside] = grid[tile_ys[inside], tile_xs[inside]]
+        return ids
+    
+    def is_position_on_tile_id(self, x, y, tile_id):
+        """Check if a position is on a specific tile ID"""
+        return self.tile_id_at(x, y) == tile_id
+    
+    def positions_on_tile_id(self, positions, tile_id):
+        """Vectorized is_position_on_tile_id: one bool per (x, y) in positions"""
+        points = np.asarray(positions).reshape(-1, 2)
+        return self.tile_ids_at(points[:, 0], points[:, 1]) == tile_id
     
     def setup_level(self):
         # Load map data
@@ -175,10 +345,8 @@ class Level:
             # Check if we should show story dialogue after death
             current_story_part = self.story_progression.progress["current_story_part"]
             if current_story_part > 0:
-                # Only start dialogue if there is dialogue to show (skip after 4 deaths)
-                dialogue = self.story_progression.get_story_dialogue(current_story_part)
-                if dialogue:  # Only start if dialogue exists
-                    self.start_story_dialogue(current_story_part)
+                # start_story_dialogue only starts if there is dialogue to show (skip after 4 deaths)
+                self.start_story_dialogue(current_story_part)
         
         # Create bow weapon using attack2_sheet (bow and arrow sprites)
         bow_frames = self.player.attack2_frames_right  # Use attack2_sheet for bow
@@ -210,6 +378,12 @@ class Level:
         pygame.draw.rect(character_surface, (100, 150, 255), (12, 36, 4, 12))
         pygame.draw.rect(character_surface, (100, 150, 255), (16, 36, 4, 12))
         
+        # Match the display's pixel format so each blit takes SDL's fast path
+        try:
+            character_surface = character_surface.convert_alpha()
+        except pygame.error:
+            pass
+        
         self.sunrise_character = character_surface
     
     def load_map(self):
@@ -223,20 +397,46 @@ class Level:
         if self.map_loader.load_map(map_file):
             print(f"Map loaded successfully: {map_file}")
             
+            # Sunrise character stands near the end of the map, above ground level
+            map_data = self.map_loader.map_data
+            self.sunrise_pos = (map_data.get('width', 0) * map_data.get('tilewidth', 32) - 100, 543 - 48)
+            
             # Create tiles from map data
             self.map_tiles = self.map_loader.create_tiles_from_map([self.visible_sprite, self.collision_sprite, self.enemy_sprite])
+            self.collision_grid.rebuild(self.collision_sprite)
+            # Enemy tiles the player's sword can hit, filtered once per map load
+            self.attackable_enemy_tiles = [tile for tile in self.enemy_sprite if getattr(tile, 'tile_id', None) in ATTACKABLE_TILE_IDS]
             
             # Create objects from map data (hearts, animated objects, etc.)
             self.map_objects = self.map_loader.create_objects_from_map([self.hearts, self.animated_objects])
             
             # Collect interactive tiles
             self.interactive_tiles = [tile for tile in self.map_tiles if hasattr(tile, 'is_interactive') and tile.is_interactive]
+            self.build_interactive_arrays()
             print(f"Created {len(self.map_tiles)} map tiles")
             print(f"Created {len(self.map_objects)} map objects")
             print(f"Found {len(self.interactive_tiles)} interactive tiles")
         else:
             print(f"Failed to load map data: {map_file}")
     
+    def build_interactive_arrays(self):
+        """Split interactive tile centers into x and y arrays, in list order"""
+        tiles = self.interactive_tiles
+        self.interactive_xs = np.fromiter((tile.rect.centerx for tile in tiles), dtype=np.int64, count=len(tiles))
+        self.interactive_ys = np.fromiter((tile.rect.centery for tile in tiles), dtype=np.int64, count=len(tiles))
+    
+    def find_nearby_interactive(self):
+        """Return the first interactive tile (in list order) within INTERACTION_DISTANCE of the player, or None"""
+        if not len(self.interactive_xs):
+            return None
+        
+        player_x, player_y = self.player.rect.center
+        dx = self.interactive_xs - player_x
+        dy = self.interactive_ys - player_y
+        in_range = dx * dx + dy * dy <= INTERACTION_DISTANCE_SQ
+        index = int(in_range.argmax())
+        return self.interactive_tiles[index] if in_range[index] else None
+    
     def check_map_transition(self):
         """Check if player has reached the end of the current map and should transition"""
         if self.map_transitioning:
@@ -273,6 +473,7 @@ class Level:
         
         # Clear current enemies and objects
         self.enemies.empty()
+        self.enemy_projectiles.empty()
         self.hearts.empty()
         self.player_arrows.empty()
         self.animated_objects.empty()  # Clear animated objects from previous map
@@ -284,6 +485,7 @@ class Level:
         
         # Clear interactive tiles
         self.interactive_tiles.clear()
+        self.build_interactive_arrays()
         
         # Switch to night time forest map
         self.current_map = "nighttime"
@@ -318,34 +520,45 @@ class Level:
         if not self.map_transitioning:
             return
         
-        # Create transition overlay
-        overlay = pygame.Surface((WIDTH, HEIGHT))
+        # Transition overlay, reused for every frame of every transition
+        # (opaque, in display format, faded with surface alpha so no per-pixel alpha is written)
+        overlay = self.transition_overlay
+        if overlay is None:
+            overlay = pygame.Surface((WIDTH, HEIGHT))
+            try:
+                overlay = overlay.convert()
+            except pygame.error:
+                pass
+            overlay.fill((0, 0, 0))
+            self.transition_overlay = overlay
         
         # Fade effect during transition
         if self.transition_progress < 0.5:
             # Fade out current map
             alpha = int(255 * (1.0 - (self.transition_progress * 2)))
-            overlay.set_alpha(alpha)
-            overlay.fill((0, 0, 0))
-            self.display_surface.blit(overlay, (0, 0))
         else:
             # Fade in new map
-            alpha = int(255 * ((self.transition_progress - 0.5) * 2))
-            overlay.set_alpha(255 - alpha)
-            overlay.fill((0, 0, 0))
-            self.display_surface.blit(overlay, (0, 0))
-        
-        # Draw transition text
-        font = pygame.font.Font(None, 48)
-        if self.current_map == "nighttime":
-            text = font.render("NightMode", True, (255, 255, 255))
-        else:
-            text = font.render("Entering Forest...", True, (255, 255, 255))
+            alpha = 255 - int(255 * ((self.transition_progress - 0.5) * 2))
+        overlay.set_alpha(alpha)
+        self.display_surface.blit(overlay, (0, 0))
         
-        text_rect = text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
+        # Draw transition text, rendered once per map
+        label = self.transition_labels.get(self.current_map)
+        if label is None:
+            font = get_font(48)
+            if self.current_map == "nighttime":
+                text = font.render("NightMode", True, (255, 255, 255))
+            else:
+                text = font.render("Entering Forest...", True, (255, 255, 255))
+            
+            text_rect = text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
+            
+            # Add background for text
+            bg_rect = text_rect.inflate(40, 20)
+            label = (text, text_rect, bg_rect)
+            self.transition_labels[self.current_map] = label
+        text, text_rect, bg_rect = label
         
-        # Add background for text
-        bg_rect = text_rect.inflate(40, 20)
         pygame.draw.rect(self.display_surface, (0, 0, 0, 150), bg_rect)
         pygame.draw.rect(self.display_surface, (255, 255, 255), bg_rect, 2)
         
@@ -353,85 +566,59 @@ class Level:
     
     def draw_sunrise_character(self):
         """Draw the static sunrise character"""
-        if self.sunrise_character and self.current_map == "forest2":
-            # Position character at the end of the map
-            map_width = self.map_loader.map_data.get('width', 0) * self.map_loader.map_data.get('tilewidth', 32)
-            char_x = map_width - 100
-            char_y = 543 - 48  # Above ground level
-            
-            # Apply camera offset
-            screen_pos = self.camera.apply_pos((char_x, char_y))
-            
-            # Only draw if visible
-            if -32 < screen_pos[0] < WIDTH and -48 < screen_pos[1] < HEIGHT:
-                self.display_surface.blit(self.sunrise_character, screen_pos)
+        if self.current_map != "forest2" or not self.sunrise_character or self.sunrise_pos is None:
+            return
+        
+        # Apply camera offset
+        screen_pos = self.camera.apply_pos(self.sunrise_pos)
+        
+        # Only draw if visible
+        if -32 < screen_pos[0] < WIDTH and -48 < screen_pos[1] < HEIGHT:
+            self.display_surface.blit(self.sunrise_character, screen_pos)
     
     def create_enemies(self):
         """Create enemies at various positions with waypoints"""
-        # Ground is from 0 to 96 pixels from bottom, so spawn enemies above ground
-        # Spawn enemies at Y position 520
-        ground_level = 520  # 520 pixels from top
-        
-        # Define enemy positions and their waypoints - 5 enemies in different areas
-        enemy_data = [
-            {
-                'pos': (200, ground_level),  # Area 1: Left side
-                'waypoints': [(200, ground_level), (300, ground_level), (400, ground_level), (300, ground_level)]
-            },
-            {
-                'pos': (800, ground_level),  # Area 2: Center-right
-                'waypoints': [(800, ground_level), (900, ground_level), (1000, ground_level), (900, ground_level)]
-            },
-            {
-                'pos': (1400, ground_level),  # Area 3: Far right
-                'waypoints': [(1400, ground_level), (1500, ground_level), (1600, ground_level), (1500, ground_level)]
-            },
-            {
-                'pos': (600, ground_level),  # Area 4: Upper area
-                'waypoints': [(600, ground_level), (700, ground_level), (800, ground_level), (700, ground_level)]
-            },
-            {
-                'pos': (1200, ground_level),  # Area 5: Middle area
-                'waypoints': [(1200, ground_level), (1300, ground_level), (1400, ground_level), (1300, ground_level)]
-            }
-        ]
-        
-        for data in enemy_data:
-            # Check if initial spawn position is not on tile ID 13
-            if not self.is_position_on_tile_id(data['pos'][0], data['pos'][1], 13):
-                enemy = EnemyFactory.create_enemy('slime', data['pos'][0], data['pos'][1], data['waypoints'])
-                self.enemies.add(enemy)
+        # Check every initial spawn position against tile ID 13 in one pass
+        on_tile_13 = self.positions_on_tile_id([pos for pos, _ in ENEMY_SPAWN_TABLE], 13)
+        for (pos, waypoints), blocked in zip(ENEMY_SPAWN_TABLE, on_tile_13):
+            if not blocked:
+                enemy = EnemyFactory.create_enemy('slime', pos[0], pos[1], waypoints)
+                self.add_enemy(enemy)
             else:
-                print(f"Skipping enemy spawn at ({data['pos'][0]}, {data['pos'][1]}) - on tile ID 13")
+                print(f"Skipping enemy spawn at ({pos[0]}, {pos[1]}) - on tile ID 13")
+    
+    def add_enemy(self, enemy):
+        """Add an enemy to the level, routing its projectiles into enemy_projectiles"""
+        enemy.shared_projectiles = self.enemy_projectiles
+        self.enemies.add(enemy)
     
     def check_projectile_collisions(self):
         """Check collisions between player and enemy projectiles"""
-        for enemy in self.enemies:
-            for projectile in enemy.projectiles:
-                if projectile.rect.colliderect(self.player.rect):
-                    # Player hit by projectile (disabled for testing)
-                    # self.player.take_damage(projectile.damage)
-                    projectile.kill()
+        # Player hit by projectile (damage disabled for testing); dokill removes it from its enemy's group too
+        pygame.sprite.spritecollide(self.player, self.enemy_projectiles, True)
     
     def check_enemy_attack_collisions(self, dialogue_active=False):
         """Check collisions between enemy attacks and player"""
-        for enemy in self.enemies:
+        # Rectangle test for every enemy in C; usually nothing is touching the player
+        if not pygame.sprite.spritecollideany(self.player, self.enemies):
+            return
+        
+        for enemy in pygame.sprite.spritecollide(self.player, self.enemies, False):
             if not enemy.is_alive:
                 continue
-                
-            # Check if enemy is colliding with player (simple rectangle collision)
-            if enemy.rect.colliderect(self.player.rect):
-                # Check if enemy can attack (not on cooldown)
-                if hasattr(enemy, 'can_attack') and enemy.can_attack(self.player):
-                    # Player takes damage
-                    self.player.take_damage(enemy.attack_damage, dialogue_active)
+            
+            # Check if enemy can attack (not on cooldown)
+            if hasattr(enemy, 'can_attack') and enemy.can_attack(self.player):
+                # Player takes damage
+                self.player.take_damage(enemy.attack_damage, dialogue_active)
+                if DEBUG:
                     print(f"Player hit by {enemy.enemy_type}! Health: {self.player.health}/{self.player.max_health}")
-                    
-                    # Flash health UI
-                    self.ui_animations['health_flash'] = 30
-                    
-                    # Set attack cooldown to prevent continuous damage
-                    enemy.attack_cooldown = enemy.attack_cooldown_time
+                
+                # Flash health UI
+                self.ui_animations['health_flash'] = 30
+                
+                # Set attack cooldown to prevent continuous damage
+                enemy.attack_cooldown = enemy.attack_cooldown_time
     
     def check_heart_collisions(self):
         """Check collisions between player and heart objects"""
@@ -442,37 +629,45 @@ class Level:
     
     def check_bow_attacks(self):
         """Handle bow attacks and arrow shooting"""
-        if (self.player.attacking and 
-            self.player.get_current_weapon() == 'bow'):
+        player = self.player
+        if (player.attacking and 
+            player.get_current_weapon() == 'bow'):
             
-            print(f"🎯 BOW ATTACK: attacking=True, weapon=bow, attack_index={self.player.attack_index}, arrow_fired={getattr(self, 'arrow_fired_this_attack', False)}")
+            if DEBUG:
+                print(f"🎯 BOW ATTACK: attacking=True, weapon=bow, attack_index={player.attack_index}, arrow_fired={getattr(self, 'arrow_fired_this_attack', False)}")
             
             # Fire arrow at frame 8 (or any frame >= 8 if animation is shorter)
-            if (int(self.player.attack_index) >= 8 and 
+            if (int(player.attack_index) >= 8 and 
                 not getattr(self, 'arrow_fired_this_attack', False)):  # Fire at frame 8 or later, only once per attack                                                                                                 
                 
-                print(f"🎯 FIRING ARROW AT FRAME {int(self.player.attack_index)}!")
+                if DEBUG:
+                    print(f"🎯 FIRING ARROW AT FRAME {int(player.attack_index)}!")
                 # Shoot arrow
-                arrow = self.bow.shoot_arrow(self.player.rect, self.player.facing_right)
+                arrow = self.bow.shoot_arrow(player.rect, player.facing_right)
                 if arrow:
                     self.player_arrows.add(arrow)
                     self.arrow_fired_this_attack = True  # Prevent multiple arrows
-                    print(f"🎯 ARROW ADDED TO LEVEL! Total arrows: {len(self.player_arrows)}")
-                else:
+                    if DEBUG:
+                        print(f"🎯 ARROW ADDED TO LEVEL! Total arrows: {len(self.player_arrows)}")
+                elif DEBUG:
                     print(f"🎯 FAILED TO ADD ARROW TO LEVEL!")
         
         # Reset flag when attack ends
-        if not self.player.attacking:
+        if not player.attacking:
             self.arrow_fired_this_attack = False
     
     def check_arrow_collisions(self):
         """Check collisions between arrows and enemies/animated objects"""
-        for arrow in self.player_arrows:
-            # Update arrow with both enemies and animated objects
-            arrow.update(self.collision_sprite, self.enemies, self.animated_objects)
-            
+        # Arrows kill() themselves on a hit or when expired, which drops them from the group;
+        # keep this frame's list so their kill info can still be scored afterwards
+        arrows = self.player_arrows.sprites()
+        
+        # Update arrows with both enemies and animated objects
+        self.player_arrows.update(self.collision_sprite, self.enemies, self.animated_objects)
+        
+        for arrow in arrows:
             # Process kill information for scoring
-            if hasattr(arrow, 'kill_info') and arrow.kill_info:
+            if arrow.kill_info:
                 kill_info = arrow.kill_info
                 
                 # Award points for enemy kills
@@ -480,141 +675,100 @@ class Level:
                     self.enemies_hit += 1
                     enemy_screen_pos = self.camera.apply_pos(kill_info["enemy_position"])
                     points_earned = self.add_score(100, "kill", enemy_screen_pos)
-                    print(f"🎯 Arrow killed enemy! +{points_earned} points (Combo: {self.combo_count}x)")
+                    if DEBUG:
+                        print(f"🎯 Arrow killed enemy! +{points_earned} points (Combo: {self.combo_count}x)")
                 
                 # Award points for animated object kills
                 elif kill_info.get("killed_animated_object"):
                     self.enemies_hit += 1
                     obj_screen_pos = self.camera.apply_pos(kill_info["object_position"])
                     points_earned = self.add_score(150, "kill", obj_screen_pos)  # Higher score for animated objects
-                    print(f"🎯 Arrow killed animated object! +{points_earned} points (Combo: {self.combo_count}x)")
+                    if DEBUG:
+                        print(f"🎯 Arrow killed animated object! +{points_earned} points (Combo: {self.combo_count}x)")
                 
                 # Clear kill info to prevent duplicate scoring
                 arrow.kill_info = None
-            
-            # Remove dead arrows
-            if not arrow.alive():
-                self.player_arrows.remove(arrow)
     
     def check_attack_collisions(self):
         """Check collisions between player attacks and enemies"""
-        if not self.player.attacking:
+        player = self.player
+        attack_hit_targets = self.attack_hit_targets
+        if not player.attacking:
             # Reset hit tracking when not attacking
-            for enemy in self.enemies:
-                if hasattr(enemy, 'hit_this_attack'):
-                    delattr(enemy, 'hit_this_attack')
-            for animated_obj in self.animated_objects:
-                if hasattr(animated_obj, 'hit_this_attack'):
-                    delattr(animated_obj, 'hit_this_attack')
+            if attack_hit_targets:
+                attack_hit_targets.clear()
             return
             
         # Create attack hitbox
-        attack_frame = int(self.player.attack_index)
-        if attack_frame >= len(self.player.current_attack_frames_right):
+        attack_frame = int(player.attack_index)
+        if attack_frame >= len(player.current_attack_frames_right):
             return
         
         # Sword hitbox - wider but shorter, closer to player
-        hitbox_width = 80  # Wider for sword length
-        hitbox_height = 30  # Shorter height for sword width
+        hitbox_width, hitbox_height = SWORD_HITBOX_SIZE
         
         # Position hitbox closer to player and lower
-        player_y = self.player.rect.centery + 50  # 50 pixels below center
+        player_centerx, player_centery = player.rect.center
+        player_y = player_centery + 50  # 50 pixels below center
         
-        if self.player.facing_right:
+        if player.facing_right:
             # Hitbox extends to the right of the player, closer and lower
-            hitbox_x = self.player.rect.centerx + 10  # Closer to player
+            hitbox_x = player_centerx + 10  # Closer to player
             hitbox_y = player_y - hitbox_height // 2  # Center on lower position
         else:
             # Hitbox extends to the left of the player, closer and lower
-            hitbox_x = self.player.rect.centerx - hitbox_width - 10  # Closer to player
+            hitbox_x = player_centerx - hitbox_width - 10  # Closer to player
             hitbox_y = player_y - hitbox_height // 2  # Center on lower position
         
-        attack_hitbox = pygame.Rect(hitbox_x, hitbox_y, hitbox_width, hitbox_height)
+        # Reuse one rect for every swing, only its position changes
+        attack_hitbox = self.attack_hitbox
+        attack_hitbox.topleft = (hitbox_x, hitbox_y)
         
-        # Debug: Draw attack hitbox in screen coordinates (remove this later)
-        # Attack hitbox debug drawing removed
+        # Debug: remember the hitbox so the draw pass can outline it
+        if DEBUG_HITBOXES:
+            self.debug_attack_hitbox = attack_hitbox
         
-        # Check collision with enemies - only one enemy can be hit per attack
-        hit_an_enemy = False
-        for enemy in self.enemies:
-            # Enemy hitbox debug drawing removed
+        # Only one target can be hit per frame: enemies first, then animated objects
+        enemies = self.enemies
+        colliderect = attack_hitbox.colliderect
+        for target in chain(enemies, self.animated_objects):
+            if target in attack_hit_targets or not target.is_alive or not colliderect(target.rect):
+                continue
             
-            # Only hit one enemy per attack
-            if not hit_an_enemy and attack_hitbox.colliderect(enemy.rect) and enemy.is_alive and not hasattr(enemy, 'hit_this_attack'):
-                # Mark enemy as hit this attack to prevent multiple hits
-                enemy.hit_this_attack = True
-                hit_an_enemy = True
-                
-                # Only count hit if enemy actually dies
-                if enemy.take_damage(1):
-                    self.enemies_hit += 1
-                    # Add score for killing enemy with position for popup
-                    enemy_screen_pos = self.camera.apply(enemy)
-                    points_earned = self.add_score(100, "kill", enemy_screen_pos)
-                    print(f"Enemy killed! +{points_earned} points (Combo: {self.combo_count}x)")
-                else:
-                    print(f"Enemy hit! Health: {enemy.health}/{enemy.max_health}")
-        
-        # Check collision with animated objects - only one can be hit per attack
-        if not hit_an_enemy:
-            print(f"DEBUG: Checking {len(self.animated_objects)} animated objects for collision")
-            for i, animated_obj in enumerate(self.animated_objects):
-                # Animated object hitbox debug drawing removed
-                print(f"DEBUG: Animated object {i}: alive={animated_obj.is_alive}, rect={animated_obj.rect}, hit_this_attack={hasattr(animated_obj, 'hit_this_attack')}")
-                print(f"DEBUG: Attack hitbox: {attack_hitbox}")
-                print(f"DEBUG: Collision check: {attack_hitbox.colliderect(animated_obj.rect)}")
-                
-                # Only hit one animated object per attack
-                if not hit_an_enemy and attack_hitbox.colliderect(animated_obj.rect) and animated_obj.is_alive and not hasattr(animated_obj, 'hit_this_attack'):
-                    print(f"DEBUG: HIT! Animated object {i} hit by attack")
-                    # Mark as hit this attack to prevent multiple hits
-                    animated_obj.hit_this_attack = True
-                    hit_an_enemy = True
-                    
-                    # Deal damage to animated object
-                    if animated_obj.take_damage(1):
-                        self.enemies_hit += 1
-                        # Add score for killing animated object
-                        obj_screen_pos = self.camera.apply(animated_obj)
-                        points_earned = self.add_score(150, "kill", obj_screen_pos)  # Higher score for animated objects
-                        print(f"Animated object killed! +{points_earned} points (Combo: {self.combo_count}x)")
-                    else:
-                        print(f"Animated object hit! Health: {animated_obj.health}/{animated_obj.max_health}")
-                    break  # Only hit one target per attack
+            # Mark as hit this attack to prevent multiple hits
+            attack_hit_targets.add(target)
+            is_enemy = enemies.has(target)
+            if DEBUG:
+                print(f"DEBUG: HIT! {'Enemy' if is_enemy else 'Animated object'} at {target.rect} hit by {attack_hitbox}")
+            
+            # Only count hit if the target actually dies
+            if target.take_damage(1):
+                self.enemies_hit += 1
+                # Add score for the kill with position for popup (animated objects are worth more)
+                points_earned = self.add_score(100 if is_enemy else 150, "kill", self.camera.apply_xy(target))
+                if DEBUG:
+                    print(f"{'Enemy' if is_enemy else 'Animated object'} killed! +{points_earned} points (Combo: {self.combo_count}x)")
+            elif DEBUG:
+                print(f"{'Enemy' if is_enemy else 'Animated object'} hit! Health: {target.health}/{target.max_health}")
+            break
 
     def check_interactions(self, keys):
         """Check if player is near interactive tiles and handle interactions"""
+        # Dialogue keys held this frame; released keys are free to fire again
+        held = ((KEY_BIT_Z if keys[pygame.K_z] else 0) | (KEY_BIT_ENTER if keys[pygame.K_RETURN] else 0) |
+                (KEY_BIT_Q if keys[pygame.K_q] else 0) | (KEY_BIT_R if keys[pygame.K_r] else 0))
+        self.latched_keys &= held
+        
         # Handle story dialogue first
         if self.show_intro_dialogue or self.story_dialogue_active:
-            # R key for starting/continuing story dialogue
-            if keys[pygame.K_r] and not self.r_pressed:
-                if self.show_intro_dialogue:
-                    self.end_intro_dialogue()  # End intro dialogue when R is pressed
-                else:
-                    self.next_story_dialogue()
-                self.r_pressed = True
-            elif not keys[pygame.K_r]:
-                self.r_pressed = False
-            
-            # Z key for continuing story dialogue
-            if keys[pygame.K_z] and not self.z_pressed:
-                if self.show_intro_dialogue:
-                    self.end_intro_dialogue()  # End intro dialogue when Z is pressed
-                else:
-                    self.next_story_dialogue()
-                self.z_pressed = True
-            elif not keys[pygame.K_z]:
-                self.z_pressed = False
-            
-            # ENTER key for continuing story dialogue
-            if keys[pygame.K_RETURN] and not self.enter_pressed:
-                if self.show_intro_dialogue:
-                    self.end_intro_dialogue()  # End intro dialogue when ENTER is pressed
-                else:
-                    self.next_story_dialogue()
-                self.enter_pressed = True
-            elif not keys[pygame.K_RETURN]:
-                self.enter_pressed = False
+            # R, Z and ENTER all start/continue story dialogue
+            for bit in (KEY_BIT_R, KEY_BIT_Z, KEY_BIT_ENTER):
+                if held & bit and not self.latched_keys & bit:
+                    if self.show_intro_dialogue:
+                        self.end_intro_dialogue()  # End intro dialogue on any of them
+                    else:
+                        self.next_story_dialogue()
+                    self.latched_keys |= bit
             
             # ESC key for exiting story dialogue
             if keys[pygame.K_ESCAPE]:
@@ -622,41 +776,23 @@ class Level:
             return
         
         # Check if player is near any interactive tile
-        self.nearby_interactive = None
-        interaction_distance = 50  # Distance in pixels to trigger interaction
-        
-        for tile in self.interactive_tiles:
-            distance = ((self.player.rect.centerx - tile.rect.centerx) ** 2 + 
-                       (self.player.rect.centery - tile.rect.centery) ** 2) ** 0.5
-            if distance <= interaction_distance:
-                self.nearby_interactive = tile
-                break
+        self.nearby_interactive = self.find_nearby_interactive()
         
         # Show interaction prompt if near interactive tile
         self.show_interaction_prompt = self.nearby_interactive is not None and not self.dialogue_active
         
         # Handle interaction input (Q key)
-        if keys[pygame.K_q] and not self.q_pressed and self.nearby_interactive and not self.dialogue_active:
+        if held & KEY_BIT_Q and not self.latched_keys & KEY_BIT_Q and self.nearby_interactive and not self.dialogue_active:
             self.start_dialogue(self.nearby_interactive.tile_id)
-            self.q_pressed = True
-        elif not keys[pygame.K_q]:
-            self.q_pressed = False
+            self.latched_keys |= KEY_BIT_Q
         
         # Handle dialogue navigation
         if self.dialogue_active:
-            # Z key for continuing dialogue
-            if keys[pygame.K_z] and not self.z_pressed:
-                self.next_dialogue()
-                self.z_pressed = True
-            elif not keys[pygame.K_z]:
-                self.z_pressed = False
-            
-            # ENTER key for continuing dialogue
-            if keys[pygame.K_RETURN] and not self.enter_pressed:
-                self.next_dialogue()
-                self.enter_pressed = True
-            elif not keys[pygame.K_RETURN]:
-                self.enter_pressed = False
+            # Z and ENTER keys for continuing dialogue
+            for bit in (KEY_BIT_Z, KEY_BIT_ENTER):
+                if held & bit and not self.latched_keys & bit:
+                    self.next_dialogue()
+                    self.latched_keys |= bit
             
             # ESC key for exiting dialogue
             if keys[pygame.K_ESCAPE]:
@@ -683,8 +819,7 @@ class Level:
         self.current_dialogue = None
         self.dialogue_index = 0
         # Reset key press flags to ensure proper input handling after dialogue
-        self.z_pressed = False
-        self.enter_pressed = False
+        self.latched_keys &= ~(KEY_BIT_Z | KEY_BIT_ENTER)
     
     def start_story_dialogue(self, story_part):
         """Start story dialogue for the given story part"""
@@ -700,7 +835,8 @@ class Level:
         """Move to next story dialogue line"""
         if self.story_dialogue_active and self.current_story_dialogue:
             self.story_dialogue_index += 1
-            print(f"Story dialogue index: {self.story_dialogue_index}/{len(self.current_story_dialogue)}")
+            if DEBUG:
+                print(f"Story dialogue index: {self.story_dialogue_index}/{len(self.current_story_dialogue)}")
             if self.story_dialogue_index >= len(self.current_story_dialogue):
                 print("Ending story dialogue - reached end")
                 self.end_story_dialogue()
@@ -713,21 +849,17 @@ class Level:
         self.story_dialogue_index = 0
         self.show_intro_dialogue = False
         # Reset key press flags to ensure proper input handling after dialogue
-        self.r_pressed = False
-        self.z_pressed = False
-        self.enter_pressed = False
+        self.latched_keys &= ~(KEY_BIT_R | KEY_BIT_Z | KEY_BIT_ENTER)
     
     def end_intro_dialogue(self):
         """End intro dialogue"""
         self.show_intro_dialogue = False
         # Reset key press flags to ensure proper input handling after dialogue
-        self.r_pressed = False
-        self.z_pressed = False
-        self.enter_pressed = False
+        self.latched_keys &= ~(KEY_BIT_R | KEY_BIT_Z | KEY_BIT_ENTER)
     
     def draw_ui(self):
         """Draw interaction prompts and dialogue"""
-        font = pygame.font.Font(None, 36)
+        font = get_font(36)
         
         # Draw story dialogue
         if self.show_intro_dialogue or self.story_dialogue_active:
@@ -754,20 +886,7 @@ class Level:
                 pygame.draw.rect(self.display_surface, (255, 215, 0), dialogue_rect, 4)  # Gold border
                 
                 # Draw dialogue text (wrapped)
-                words = dialogue_text.split()
-                lines = []
-                current_line = ""
-                
-                for word in words:
-                    test_line = current_line + (" " if current_line else "") + word
-                    if font.size(test_line)[0] < dialogue_rect.width - 20:
-                        current_line = test_line
-                    else:
-                        if current_line:
-                            lines.append(current_line)
-                        current_line = word
-                if current_line:
-                    lines.append(current_line)
+                lines = _wrap_text(dialogue_text, font, dialogue_rect.width - 20)
                 
                 # Draw each line
                 y_offset = dialogue_rect.y + 15
@@ -775,32 +894,32 @@ class Level:
                 max_lines = 6 if self.show_intro_dialogue else 8 if self.story_dialogue_active else 3
                 for i, line in enumerate(lines[:max_lines]):
                     # Style controls differently
-                    if (self.show_intro_dialogue and line in ["CONTROLS:", "Arrow Keys - Move Left/Right", "SPACE - Jump", "F - Attack with Sword"]) or \
-                       (self.story_dialogue_active and line in ["HEART CONTROLS:", "BOW CONTROLS:", "I - Open/Close Inventory", "1-0 - Select Heart Slot", "W - Use Selected Heart", "E - Switch Sword/Bow", "F - Fire Arrow (when bow selected)", "Arrow Keys - Aim Direction"]):
-                        if line in ["CONTROLS:", "HEART CONTROLS:", "BOW CONTROLS:"]:
+                    if (self.show_intro_dialogue and line in INTRO_CONTROL_LINES) or \
+                       (self.story_dialogue_active and line in STORY_CONTROL_LINES):
+                        if line in CONTROL_TITLE_LINES:
                             text_color = (255, 215, 0)  # Gold for title
                         else:
                             text_color = (200, 255, 200)  # Light green for controls
                     else:
                         text_color = (255, 255, 255)  # White for regular text
                     
-                    text_surface = font.render(line, True, text_color)
+                    text_surface = _render_text(font, line, text_color)
                     text_rect = text_surface.get_rect(centerx=dialogue_rect.centerx, y=y_offset)
                     self.display_surface.blit(text_surface, text_rect)
                     y_offset += 25
                 
                 # Draw continue prompt
                 if self.show_intro_dialogue:
-                    continue_text = font.render("Press R to begin", True, (255, 215, 0))
+                    continue_text = _render_text(font, "Press R to begin", (255, 215, 0))
                 else:
-                    continue_text = font.render("Press R, Z, or ENTER to continue", True, (200, 200, 200))
+                    continue_text = _render_text(font, "Press R, Z, or ENTER to continue", (200, 200, 200))
                 continue_rect = continue_text.get_rect(centerx=dialogue_rect.centerx, y=dialogue_rect.bottom - 25)
                 self.display_surface.blit(continue_text, continue_rect)
             return
         
         # Draw interaction prompt
         if self.show_interaction_prompt:
-            prompt_text = font.render("Press Q to interact", True, (255, 255, 255))
+            prompt_text = _render_text(font, "Press Q to interact", (255, 255, 255))
             prompt_rect = prompt_text.get_rect(center=(WIDTH // 2, HEIGHT - 100))
             
             # Draw background for prompt
@@ -820,42 +939,29 @@ class Level:
             pygame.draw.rect(self.display_surface, (255, 255, 255), dialogue_rect, 3)
             
             # Draw dialogue text (wrapped)
-            words = dialogue_text.split()
-            lines = []
-            current_line = ""
-            
-            for word in words:
-                test_line = current_line + (" " if current_line else "") + word
-                if font.size(test_line)[0] < dialogue_rect.width - 20:
-                    current_line = test_line
-                else:
-                    if current_line:
-                        lines.append(current_line)
-                    current_line = word
-            if current_line:
-                lines.append(current_line)
+            lines = _wrap_text(dialogue_text, font, dialogue_rect.width - 20)
             
             # Draw each line
             y_offset = dialogue_rect.y + 20
             for line in lines[:3]:  # Max 3 lines
-                text_surface = font.render(line, True, (255, 255, 255))
+                text_surface = _render_text(font, line, (255, 255, 255))
                 text_rect = text_surface.get_rect(centerx=dialogue_rect.centerx, y=y_offset)
                 self.display_surface.blit(text_surface, text_rect)
                 y_offset += 30
             
             # Draw continue prompt
-            continue_text = font.render("Press Z or ENTER to continue or ESC to exit", True, (200, 200, 200))
+            continue_text = _render_text(font, "Press Z or ENTER to continue or ESC to exit", (200, 200, 200))
             continue_rect = continue_text.get_rect(centerx=dialogue_rect.centerx, y=dialogue_rect.bottom - 30)
             self.display_surface.blit(continue_text, continue_rect)
 
     def initialize_game_data(self):
-        """Initialize all game data through API"""
+        """Initialize all game data through API (runs on _api_pool)"""
         if self.game_data_initialized:
             return
             
         try:
             # Initialize all game data through API
-            init_result = self.api_client.initialize_game_data()
+            init_result = self.worker_api_client.initialize_game_data()
             
             if init_result["success"]:
                 self.api_connected = True
@@ -871,8 +977,15 @@ class Level:
             self.api_connected = False
             print(f"❌ Unexpected error initializing game data: {e}")
     
+    def poll_api_tasks(self):
+        """Drop finished background API calls (they update the level's flags themselves)"""
+        if self.api_init_future is not None and self.api_init_future.done():
+            self.api_init_future = None
+        if self.save_future is not None and self.save_future.done():
+            self.save_future = None
+    
     def save_game_session(self):
-        """Save complete game session through API"""
+        """Save complete game session through API (runs on _api_pool)"""
         if not self.api_connected or self.score_saved:
             return
             
@@ -890,7 +1003,7 @@ class Level:
             }
             
             # Calculate currency reward based on score
-            currency_result = self.api_client.calculate_currency(self.score)
+            currency_result = self.worker_api_client.calculate_currency(self.score)
             if currency_result.get("currency_earned", 0) > 0:
                 print(f"💰 Earned {currency_result['currency_earned']} coins! ({currency_result['rule_applied']})")
                 self.currency_earned = currency_result['currency_earned']
@@ -901,7 +1014,7 @@ class Level:
                 self.currency_rule = None
             
             # Save complete game session
-            save_result = self.api_client.save_game_session(score_data)
+            save_result = self.worker_api_client.save_game_session(score_data)
             
             if save_result["success"]:
                 self.score_saved = True
@@ -949,8 +1062,8 @@ class Level:
             print(f"❌ Failed to update player data: {e}")
             return False
 
-    def run(self, keys, collision_sprites):
-        #run whole game(level)
+    def run(self, keys, collision_sprites, pressed_keys=()):
+        #run whole game(level); pressed_keys holds the keys pressed down this frame
         
         # Check for heart purchases from API
         system_id = None
@@ -966,6 +1079,7 @@ class Level:
                 self.player.sync_inventory_from_story_progress()
         
         # API calls removed from mid-game - only happen at start and end
+        self.poll_api_tasks()
         
         # Update survival time and UI animations
         self.update_survival_time()
@@ -974,15 +1088,17 @@ class Level:
         # Check if game is over
         if self.player.health <= 0:
             self.game_over = True
-            # Save complete game session when game over
-            self.save_game_session()
+            # Save complete game session when game over, once the startup sync has finished
+            if (self.api_init_future is None and self.save_future is None
+                    and self.api_connected and not self.score_saved):
+                self.save_future = _api_pool.submit(self.save_game_session)
             # Don't show story dialogue during death screen - it will be shown after restart
             # Don't return here - let the game over screen be drawn
         
         # Update player with proper argumentalsono 
         # Check if any dialogue is active
         dialogue_active = self.show_intro_dialogue or self.story_dialogue_active
-        self.player.update(keys, collision_sprites, self.enemy_sprite, dialogue_active)
+        self.player.update(keys, collision_sprites, self.attackable_enemy_tiles, dialogue_active, pressed_keys)
         
         # Update player's story progression abilities
         self.player.update_story_progression()
@@ -990,16 +1106,19 @@ class Level:
         # Sync inventory with story progress for real-time updates
         self.player.sync_inventory_from_story_progress()
         
-        # Update enemies
+        # Update enemies (slimes also take the level for climbing checks and culling)
+        camera_rect = self.camera.camera
+        self.camera_cull_rect.topleft = (-camera_rect.x - ENEMY_CULL_MARGIN, -camera_rect.y - ENEMY_CULL_MARGIN)
+        player = self.player
         for enemy in self.enemies:
-            if hasattr(enemy, 'update') and enemy.__class__.__name__ == 'SlimeEnemy':
-                enemy.update(self.player, collision_sprites, self)
+            if isinstance(enemy, SlimeEnemy):
+                enemy.update(player, collision_sprites, self)
             else:
-                enemy.update(self.player, collision_sprites)
+                enemy.update(player, collision_sprites)
         
         # Update animated objects
         for animated_obj in self.animated_objects:
-            animated_obj.update(self.player, self)
+            animated_obj.update(player, self)
         
         # Spawn enemies if less than max
         self.spawn_enemies_if_needed()
@@ -1013,7 +1132,7 @@ class Level:
         self.check_heart_collisions()
         
         # Update bow and check bow attacks and arrow collisions
-        self.bow.update(self.player.rect, self.player.facing_right, self.player.attacking)
+        self.bow.update(player.rect, player.facing_right, player.attacking)
         self.check_bow_attacks()
         self.check_arrow_collisions()
         
@@ -1030,31 +1149,38 @@ class Level:
         self.update_map_transition()
         
         # Update camera to follow player
-        self.camera.update(self.player)
+        self.camera.update(player)
         
         # Clear the screen - let background layers provide the sky color
         # self.display_surface.fill((135, 206, 235))  # Sky blue background
         
-        # Draw map tiles first (only those visible in camera viewport)
+        # Draw map tiles first (only those visible in camera viewport), batched into one blits call
+        camera = self.camera
+        apply_xy = camera.apply_xy
+        display_surface = self.display_surface
+        camera_x, camera_y = camera.camera.topleft
+        viewport_width = camera.viewport_width
+        tile_blits = []
         for tile in self.map_tiles:
-            screen_pos = self.camera.apply(tile)
+            x = tile.rect.x + camera_x
+            y = tile.rect.y + camera_y
             # Only draw tiles that are within the camera viewport
-            if (screen_pos.x > -32 and screen_pos.x < self.camera.viewport_width and 
-                screen_pos.y > -32 and screen_pos.y < HEIGHT):
-                self.display_surface.blit(tile.image, screen_pos)
+            if -32 < x < viewport_width and -32 < y < HEIGHT:
+                tile_blits.append((tile.image, (x, y)))
+        display_surface.blits(tile_blits, doreturn=0)
         
         # Draw hearts only if hearts are unlocked
-        if self.player.can_use_hearts:
+        if player.can_use_hearts:
             for heart in self.hearts:
                 if not heart.collected:
-                    screen_pos = self.camera.apply(heart)
-                    heart.draw(self.display_surface, screen_pos)
+                    screen_pos = apply_xy(heart)
+                    heart.draw(display_surface, screen_pos)
         
         # Draw animated objects (only if visible)
         for animated_obj in self.animated_objects:
             if animated_obj.visible:
-                screen_pos = self.camera.apply(animated_obj)
-                self.display_surface.blit(animated_obj.image, screen_pos)
+                screen_pos = apply_xy(animated_obj)
+                display_surface.blit(animated_obj.image, screen_pos)
                 
                 # Draw health bar above animated object
                 if animated_obj.is_alive:
@@ -1063,21 +1189,26 @@ class Level:
         # Draw enemies (only alive ones)
         for enemy in self.enemies:
             if enemy.is_alive:
-                # Use camera.apply() to ensure enemy is always visible
-                screen_pos = self.camera.apply(enemy)
-                enemy.draw(self.display_surface, screen_pos)
+                # Use camera.apply_xy() to ensure enemy is always visible
+                screen_pos = apply_xy(enemy)
+                enemy.draw(display_surface, screen_pos)
             
             # Draw enemy projectiles
             for projectile in enemy.projectiles:
-                projectile_screen_pos = self.camera.apply(projectile)
-                projectile.draw(self.display_surface, projectile_screen_pos)
+                projectile_screen_pos = apply_xy(projectile)
+                projectile.draw(display_surface, projectile_screen_pos)
         
         # Draw player on top
-        screen_pos = self.camera.apply(self.player)
-        self.display_surface.blit(self.player.image, screen_pos)
+        screen_pos = apply_xy(player)
+        display_surface.blit(player.image, screen_pos)
         
         # Weapon animation is handled by the player sprite itself
         
+        # Debug: outline the sword hitbox while attacking
+        if DEBUG_HITBOXES and player.attacking and self.debug_attack_hitbox:
+            pygame.draw.rect(display_surface, (255, 0, 0),
+                             self.debug_attack_hitbox.move(camera_x, 0), 1)
+        
         # Draw sunrise character (only during daytime)
         self.draw_sunrise_character()
         
@@ -1098,13 +1229,8 @@ class Level:
         self.draw_map_transition()
         
         # Draw player arrows
-        if len(self.player_arrows) > 0:
-            print(f"🎯 DRAWING {len(self.player_arrows)} arrows")
-            for arrow in self.player_arrows:
-                print(f"🎯 Drawing arrow at {arrow.rect}")
-                arrow.draw(self.display_surface, self.camera)
-        else:
-            print(f"🎯 NO ARROWS TO DRAW")
+        for arrow in self.player_arrows:
+            arrow.draw(display_surface, camera)
         
         # Draw game over screen on top of everything
         if self.game_over:
@@ -1121,9 +1247,12 @@ class Level:
         UI_BG_ALPHA = 180
         UI_CORNER_RADIUS = 8
         
-        # Create semi-transparent background panels
-        panel_bg = pygame.Surface((300, 150), pygame.SRCALPHA)
-        pygame.draw.rect(panel_bg, (0, 0, 0, UI_BG_ALPHA), (0, 0, 300, 150), border_radius=UI_CORNER_RADIUS)
+        # Semi-transparent background panel, built on the first draw and reused for both panels
+        panel_bg = self.stats_panel
+        if panel_bg is None:
+            panel_bg = pygame.Surface((300, 150), pygame.SRCALPHA)
+            pygame.draw.rect(panel_bg, (0, 0, 0, UI_BG_ALPHA), (0, 0, 300, 150), border_radius=UI_CORNER_RADIUS)
+            self.stats_panel = panel_bg
         
         # Left panel (Health, Score, Combo)
         self.display_surface.blit(panel_bg, (UI_PADDING, UI_PADDING))
@@ -1132,12 +1261,9 @@ class Level:
         self.display_surface.blit(panel_bg, (WIDTH - 320, UI_PADDING))
         
         # Fonts
-        font_large = pygame.font.Font(None, 32)
-        font_medium = pygame.font.Font(None, 24)
-        font_small = pygame.font.Font(None, 18)
-        
-        # Count alive enemies
-        alive_enemies = sum(1 for enemy in self.enemies if enemy.is_alive)
+        font_large = get_font(32)
+        font_medium = get_font(24)
+        font_small = get_font(18)
         
         # Left Panel Content
         left_x = UI_PADDING + 15
@@ -1158,7 +1284,7 @@ class Level:
         if health_percent < 0.3 and self.ui_animations['health_flash'] > 0:
             health_color = (255, 255, 255)  # White flash
         
-        health_text = font_medium.render("HEALTH", True, (200, 200, 200))
+        health_text = _render_text(font_medium, "HEALTH", (200, 200, 200))
         self.display_surface.blit(health_text, (left_x, left_y))
         
         # Health bar background with border
@@ -1181,11 +1307,11 @@ class Level:
         if self.ui_animations['health_flash'] > 0:
             health_text_color = (255, 100, 100)
         
-        health_value = font_small.render(f"{self.player.health}/{self.player.max_health}", True, health_text_color)
+        health_value = _render_text(font_small, f"{self.player.health}/{self.player.max_health}", health_text_color)
         self.display_surface.blit(health_value, (left_x + 210, left_y + 25))
         
         # Score with flash effect
-        score_text = font_medium.render("SCORE", True, (200, 200, 200))
+        score_text = _render_text(font_medium, "SCORE", (200, 200, 200))
         self.display_surface.blit(score_text, (left_x, left_y + 50))
         
         # Score value with flash effect
@@ -1206,7 +1332,7 @@ class Level:
             self.display_surface.blit(combo_text, (left_x + 150, left_y + 50))
         
         # Weapon display - positioned below combo to fit within panel
-        weapon_text = font_medium.render("WEAPON", True, (200, 200, 200))
+        weapon_text = _render_text(font_medium, "WEAPON", (200, 200, 200))
         self.display_surface.blit(weapon_text, (left_x, left_y + 100))
         
         # Weapon type with color coding
@@ -1218,7 +1344,7 @@ class Level:
             weapon_name = "Sword"
             weapon_color = (255, 200, 100)  # Orange for melee weapon
         
-        weapon_value = font_small.render(weapon_name, True, weapon_color)
+        weapon_value = _render_text(font_small, weapon_name, weapon_color)
         self.display_surface.blit(weapon_value, (left_x, left_y + 120))
         
         # Right Panel Content
@@ -1226,7 +1352,7 @@ class Level:
         right_y = UI_PADDING + 15
         
         # Survival Time
-        time_text = font_medium.render("TIME", True, (200, 200, 200))
+        time_text = _render_text(font_medium, "TIME", (200, 200, 200))
         self.display_surface.blit(time_text, (right_x, right_y))
         
         minutes = self.survival_time // 60
@@ -1246,7 +1372,7 @@ class Level:
         for popup in self.score_popups:
             if popup['alpha'] > 0:
                 # Create text surface with alpha
-                font = pygame.font.Font(None, int(24 * popup['scale']))
+                font = get_font(int(24 * popup['scale']))
                 text_surface = font.render(popup['text'], True, (255, 215, 0))  # Gold color
                 
                 # Create surface with alpha
@@ -1258,39 +1384,49 @@ class Level:
                 text_rect = text_surface.get_rect(center=(popup['x'], popup['y']))
                 self.display_surface.blit(popup_surface, text_rect)
     
+    def render_stat_text(self, slot, font, text, color):
+        """Render a per-run value (score, time, ...) once, keeping only its latest surface per slot"""
+        cached = self.stat_texts.get(slot)
+        if cached is not None and cached[0] == (font, text, color):
+            return cached[1]
+        surface = font.render(text, True, color)
+        self.stat_texts[slot] = ((font, text, color), surface)
+        return surface
+    
+    def get_end_screen_overlay(self):
+        """Return the dimming overlay shared by the game over and win screens, building it once"""
+        overlay = self.end_screen_overlay
+        if overlay is None:
+            overlay = pygame.Surface((WIDTH, HEIGHT))
+            try:
+                overlay = overlay.convert()
+            except pygame.error:
+                pass
+            overlay.set_alpha(120)  # More transparent so game is visible
+            overlay.fill((0, 0, 0))
+            self.end_screen_overlay = overlay
+        return overlay
+    
     def draw_game_over_screen(self):
         """Draw game over screen"""
-        # Create semi-transparent overlay so game is visible behind
-        overlay = pygame.Surface((WIDTH, HEIGHT))
-        overlay.set_alpha(120)  # More transparent so game is visible
-        overlay.fill((0, 0, 0))
-        self.display_surface.blit(overlay, (0, 0))
+        # Semi-transparent overlay so game is visible behind
+        self.display_surface.blit(self.get_end_screen_overlay(), (0, 0))
         
         # Draw game over text with smaller fonts to prevent overlapping
-        font_large = pygame.font.Font(None, 80)   # Smaller main title
-        font_medium = pygame.font.Font(None, 48)  # Smaller medium text
-        font_small = pygame.font.Font(None, 36)   # Smaller small text
+        font_large = get_font(80)   # Smaller main title
+        font_medium = get_font(48)  # Smaller medium text
+        font_small = get_font(36)   # Smaller small text
         
         # Main game over text with outline for better visibility
-        game_over_text = font_large.render("GAME OVER", True, (255, 0, 0))
+        game_over_text = _render_outlined_text(font_large, "GAME OVER", (255, 0, 0), (0, 0, 0))
         game_over_rect = game_over_text.get_rect(center=(WIDTH//2, HEIGHT//2 - 120))
-        
-        # Draw outline
-        outline_color = (0, 0, 0)
-        for dx in [-2, 0, 2]:
-            for dy in [-2, 0, 2]:
-                if dx != 0 or dy != 0:
-                    outline_rect = game_over_text.get_rect(center=(WIDTH//2 + dx, HEIGHT//2 - 120 + dy))
-                    outline_surface = font_large.render("GAME OVER", True, outline_color)
-                    self.display_surface.blit(outline_surface, outline_rect)
-        
         self.display_surface.blit(game_over_text, game_over_rect)
         
-        you_died_text = font_medium.render("Luna Has Fallen...", True, (255, 255, 255))
+        you_died_text = _render_text(font_medium, "Luna Has Fallen...", (255, 255, 255))
         you_died_rect = you_died_text.get_rect(center=(WIDTH//2, HEIGHT//2 - 60))
         self.display_surface.blit(you_died_text, you_died_rect)
         
-        learning_text = font_small.render("But each fall teaches her something new...", True, (200, 200, 200))
+        learning_text = _render_text(font_small, "But each fall teaches her something new...", (200, 200, 200))
         learning_rect = learning_text.get_rect(center=(WIDTH//2, HEIGHT//2 - 20))
         self.display_surface.blit(learning_text, learning_rect)
         
@@ -1298,7 +1434,7 @@ class Level:
         score_breakdown = self.get_score_breakdown()
         
         # Final Score
-        final_score_text = font_medium.render(f"FINAL SCORE: {self.score:,}", True, (255, 215, 0))
+        final_score_text = self.render_stat_text("final_score", font_medium, f"FINAL SCORE: {self.score:,}", (255, 215, 0))
         final_score_rect = final_score_text.get_rect(center=(WIDTH//2, HEIGHT//2 - 10))
         self.display_surface.blit(final_score_text, final_score_rect)
         
@@ -1307,26 +1443,26 @@ class Level:
         stats_spacing = 40  # Increased spacing
         
         # Time survived
-        time_text = font_small.render(f"Time Survived: {score_breakdown['survival_time']}s", True, (100, 255, 100))
+        time_text = self.render_stat_text("time_survived", font_small, f"Time Survived: {score_breakdown['survival_time']}s", (100, 255, 100))
         time_rect = time_text.get_rect(center=(WIDTH//2, stats_y))
         self.display_surface.blit(time_text, time_rect)
         
         # Enemies killed - REMOVED from end screen
         
         # Max combo
-        combo_text = font_small.render(f"Max Combo: {score_breakdown['max_combo']}x", True, (255, 100, 100))
+        combo_text = self.render_stat_text("max_combo", font_small, f"Max Combo: {score_breakdown['max_combo']}x", (255, 100, 100))
         combo_rect = combo_text.get_rect(center=(WIDTH//2, stats_y + stats_spacing))
         self.display_surface.blit(combo_text, combo_rect)
         
         # Restart instruction with more space
-        restart_text = font_small.render("Press R for Luna to try again or ESC to exit", True, (200, 200, 200))
+        restart_text = _render_text(font_small, "Press R for Luna to try again or ESC to exit", (200, 200, 200))
         restart_rect = restart_text.get_rect(center=(WIDTH//2, stats_y + stats_spacing * 2 + 20))
         self.display_surface.blit(restart_text, restart_rect)
         
         # Add blinking effect for restart instruction
         import time
         if int(time.time() * 2) % 2:  # Blink every 0.5 seconds
-            restart_text = font_small.render("Press R for Luna to try again or ESC to exit", True, (255, 255, 255))
+            restart_text = _render_text(font_small, "Press R for Luna to try again or ESC to exit", (255, 255, 255))
             self.display_surface.blit(restart_text, restart_rect)
         
         # Currency and API Status
@@ -1334,25 +1470,25 @@ class Level:
         
         # Currency earned display
         if self.currency_earned > 0:
-            currency_text = font_medium.render(f"💰 +{self.currency_earned} Coins Earned!", True, (255, 215, 0))
+            currency_text = self.render_stat_text("currency", font_medium, f"💰 +{self.currency_earned} Coins Earned!", (255, 215, 0))
             currency_rect = currency_text.get_rect(center=(WIDTH//2, api_y))
             self.display_surface.blit(currency_text, currency_rect)
             
             if self.currency_rule:
-                rule_text = font_small.render(f"({self.currency_rule})", True, (200, 200, 200))
+                rule_text = self.render_stat_text("currency_rule", font_small, f"({self.currency_rule})", (200, 200, 200))
                 rule_rect = rule_text.get_rect(center=(WIDTH//2, api_y + 30))
                 self.display_surface.blit(rule_text, rule_rect)
         else:
-            no_currency_text = font_small.render("No coins earned this round", True, (150, 150, 150))
+            no_currency_text = _render_text(font_small, "No coins earned this round", (150, 150, 150))
             no_currency_rect = no_currency_text.get_rect(center=(WIDTH//2, api_y))
             self.display_surface.blit(no_currency_text, no_currency_rect)
         
         # API Connection Status
         api_status_y = api_y + 60
         if self.api_connected:
-            api_status_text = font_small.render("✓ Score and currency saved", True, (100, 255, 100))
+            api_status_text = _render_text(font_small, "✓ Score and currency saved", (100, 255, 100))
         else:
-            api_status_text = font_small.render("✗ Offline mode - data not saved", True, (255, 100, 100))
+            api_status_text = _render_text(font_small, "✗ Offline mode - data not saved", (255, 100, 100))
         
         api_status_rect = api_status_text.get_rect(center=(WIDTH//2, api_status_y))
         self.display_surface.blit(api_status_text, api_status_rect)
@@ -1427,34 +1563,22 @@ class Level:
 
     def draw_win_screen(self):
         """Draw win screen when player completes the night map"""
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((WIDTH, HEIGHT))
-        overlay.set_alpha(120)
-        overlay.fill((0, 0, 0))
-        self.display_surface.blit(overlay, (0, 0))
+        # Semi-transparent overlay
+        self.display_surface.blit(self.get_end_screen_overlay(), (0, 0))
         
         # Draw win text with smaller fonts
-        font_large = pygame.font.Font(None, 80)
-        font_medium = pygame.font.Font(None, 48)
-        font_small = pygame.font.Font(None, 36)
+        font_large = get_font(80)
+        font_medium = get_font(48)
+        font_small = get_font(36)
         
         # Main win text with outline
-        win_text = font_large.render("VICTORY!", True, (255, 215, 0))
+        # Win text with outline
+        win_text = _render_outlined_text(font_large, "VICTORY!", (255, 215, 0), (0, 0, 0))
         win_rect = win_text.get_rect(center=(WIDTH//2, HEIGHT//2 - 120))
-        
-        # Draw outline
-        outline_color = (0, 0, 0)
-        for dx in [-2, 0, 2]:
-            for dy in [-2, 0, 2]:
-                if dx != 0 or dy != 0:
-                    outline_rect = win_text.get_rect(center=(WIDTH//2 + dx, HEIGHT//2 - 120 + dy))
-                    outline_surface = font_large.render("VICTORY!", True, outline_color)
-                    self.display_surface.blit(outline_surface, outline_rect)
-        
         self.display_surface.blit(win_text, win_rect)
         
         # Congratulations text
-        congrats_text = font_medium.render("Luna has completed her endless lesson!", True, (255, 255, 255))
+        congrats_text = _render_text(font_medium, "Luna has completed her endless lesson!", (255, 255, 255))
         congrats_rect = congrats_text.get_rect(center=(WIDTH//2, HEIGHT//2 - 60))
         self.display_surface.blit(congrats_text, congrats_rect)
         
@@ -1462,7 +1586,7 @@ class Level:
         score_breakdown = self.get_score_breakdown()
         
         # Final Score
-        final_score_text = font_medium.render(f"FINAL SCORE: {self.score:,}", True, (255, 215, 0))
+        final_score_text = self.render_stat_text("final_score", font_medium, f"FINAL SCORE: {self.score:,}", (255, 215, 0))
         final_score_rect = final_score_text.get_rect(center=(WIDTH//2, HEIGHT//2 - 10))
         self.display_surface.blit(final_score_text, final_score_rect)
         
@@ -1471,26 +1595,26 @@ class Level:
         stats_spacing = 40
         
         # Time survived
-        time_text = font_small.render(f"Time Survived: {score_breakdown['survival_time']}s", True, (100, 255, 100))
+        time_text = self.render_stat_text("time_survived", font_small, f"Time Survived: {score_breakdown['survival_time']}s", (100, 255, 100))
         time_rect = time_text.get_rect(center=(WIDTH//2, stats_y))
         self.display_surface.blit(time_text, time_rect)
         
         # Enemies killed - REMOVED from end screen
         
         # Max combo
-        combo_text = font_small.render(f"Max Combo: {score_breakdown['max_combo']}x", True, (255, 100, 100))
+        combo_text = self.render_stat_text("max_combo", font_small, f"Max Combo: {score_breakdown['max_combo']}x", (255, 100, 100))
         combo_rect = combo_text.get_rect(center=(WIDTH//2, stats_y + stats_spacing))
         self.display_surface.blit(combo_text, combo_rect)
         
         # Restart instruction
-        restart_text = font_small.render("Press R to play again or ESC to exit", True, (200, 200, 200))
+        restart_text = _render_text(font_small, "Press R to play again or ESC to exit", (200, 200, 200))
         restart_rect = restart_text.get_rect(center=(WIDTH//2, stats_y + stats_spacing * 2 + 20))
         self.display_surface.blit(restart_text, restart_rect)
         
         # Add blinking effect for restart instruction
         import time
         if int(time.time() * 2) % 2:  # Blink every 0.5 seconds
-            restart_text = font_small.render("Press R to play again or ESC to exit", True, (255, 255, 255))
+            restart_text = _render_text(font_small, "Press R to play again or ESC to exit", (255, 255, 255))
             self.display_surface.blit(restart_text, restart_rect)
 
     def spawn_enemies_if_needed(self):
@@ -1502,7 +1626,7 @@ class Level:
         alive_enemies = sum(1 for enemy in self.enemies if enemy.is_alive)
         
         # Log alive enemy count every 60 frames (1 second) to see when count exceeds 5
-        if self.enemy_spawn_timer % 60 == 0:
+        if DEBUG and self.enemy_spawn_timer % 60 == 0:
             print(f"Alive Enemies: {alive_enemies} (Total Enemies: {len(self.enemies)})")
         
         # Spawn new enemy if timer is up OR if we have fewer than minimum enemies
@@ -1559,7 +1683,7 @@ class Level:
             ]
             
             enemy = EnemyFactory.create_enemy('slime', spawn_x, spawn_y, waypoints)
-            self.enemies.add(enemy)
+            self.add_enemy(enemy)
             self.visible_sprite.add(enemy)
             
             # Reset timer
@@ -1592,7 +1716,7 @@ class Level:
         pygame.draw.rect(self.display_surface, (255, 255, 255), border_rect, 1)
 
     def get_collision_sprites(self):
-        return self.collision_sprite
+        return self.collision_grid
 
 
 
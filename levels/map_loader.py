@@ -1,6 +1,7 @@
 import pygame
 import json
 import os
+import numpy as np
 from config import *
 from levels.tile import Tile
 
@@ -12,6 +13,8 @@ class MapLoader:
         self.tilesets = []  # Store multiple tilesets
         self.current_map_path = None  # Track current map path
         self.map_data = None
+        self.ground_layer = None  # (tile_w, tile_h, map_w, map_h, data) of the first layer
+        self.ground_grid = None  # First-layer tile IDs as a (map_h, map_w) array for bulk lookups
         
     def load_tileset(self, tileset_path):
         """Load tileset data from JSON file"""
@@ -36,6 +39,8 @@ class MapLoader:
             print(f"Loaded map: {map_path}")
             print(f"Map size: {self.map_data.get('width', 0)}x{self.map_data.get('height', 0)}")
             print(f"Infinite: {self.map_data.get('infinite', False)}")
+            self.ground_layer = self._build_ground_layer()
+            self.ground_grid = self._build_ground_grid()
             
             # Load all tilesets referenced in the map
             if 'tilesets' in self.map_data:
@@ -62,6 +67,30 @@ class MapLoader:
             print(f"Invalid JSON in map file: {map_path}")
             return False
     
+    def _build_ground_layer(self):
+        """Cache first-layer geometry and tile data so per-frame lookups skip the dict chain"""
+        map_width = self.map_data.get('width', 0)
+        map_height = self.map_data.get('height', 0)
+        layers = self.map_data.get('layers', [])
+        if map_width == 0 or map_height == 0 or not layers:
+            return None
+        return (
+            self.map_data.get('tilewidth', 32),
+            self.map_data.get('tileheight', 32),
+            map_width,
+            map_height,
+            layers[0].get('data', []),
+        )
+    
+    def _build_ground_grid(self):
+        """Reshape the first layer's tile IDs into rows, or None if the data doesn't fill the map"""
+        if self.ground_layer is None:
+            return None
+        _, _, map_width, map_height, data = self.ground_layer
+        if len(data) != map_width * map_height:
+            return None
+        return np.asarray(data, dtype=np.int32).reshape(map_height, map_width)
+    
     def _load_single_tileset(self, tileset_path):
         """Load a single tileset from JSON file"""
         try:
@@ -1,7 +1,7 @@
 import pygame, sys
 from config import *
 from entities.player import Player
-from levels.level import Level
+from levels.level import Level, shutdown_api_pool
 from levels.background import LayeredBackground
 from start_screen import StartScreen
 from api_client import LunaAPIClient
@@ -31,6 +31,7 @@ def run_start_screen():
     action = start_screen.run(screen)
     
     if action == "quit_game":
+        shutdown_api_pool()
         pygame.quit()
         sys.exit()
     elif action in ["start_game", "setup_complete"]:
@@ -47,8 +48,11 @@ def run_game():
     while True:
         clock.tick(FPS)
 
+        # Keys pressed down this frame, for actions that should fire once per press
+        pressed_keys = set()
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                shutdown_api_pool()
                 pygame.quit()
                 sys.exit()
             
@@ -60,6 +64,7 @@ def run_game():
                         background = create_background_for_map(level.current_map)
                         continue
                     elif event.key == pygame.K_ESCAPE:
+                        shutdown_api_pool()
                         pygame.quit()
                         sys.exit()
                 continue
@@ -72,10 +77,13 @@ def run_game():
                         background = create_background_for_map(level.current_map)
                         continue
                     elif event.key == pygame.K_ESCAPE:
+                        shutdown_api_pool()
                         pygame.quit()
                         sys.exit()
                 continue
             
+            if event.type == pygame.KEYDOWN:
+                pressed_keys.add(event.key)
 
         keys = pygame.key.get_pressed()
 
@@ -88,14 +96,14 @@ def run_game():
 
         camera_offset = level.camera.camera.topleft
         
-        print(f"Camera X Offset: {camera_offset[0]:.1f} | Camera Y Offset: {camera_offset[1]:.1f} | Player X: {level.player.rect.centerx} | Player Y: {level.player.rect.bottom} | Ground Level: {HEIGHT - GROUND_HEIGHT}")
+        if DEBUG:
+            print(f"Camera X Offset: {camera_offset[0]:.1f} | Camera Y Offset: {camera_offset[1]:.1f} | Player X: {level.player.rect.centerx} | Player Y: {level.player.rect.bottom} | Ground Level: {HEIGHT - GROUND_HEIGHT}")
         
-        fill_color = background.get_background_fill_color()
-        screen.fill(fill_color)
+        background.clear(screen)
         
         background.draw(screen, camera_offset)
         
-        level.run(keys, collision_sprites)
+        level.run(keys, collision_sprites, pressed_keys)
 
 
         pygame.display.flip()
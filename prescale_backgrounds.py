@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Pre-scale background layers for Luna's Endless Lesson
+Writes a <name>.scaled-<factor>.png next to each layer image so the game
+loads it directly instead of calling pygame.transform.scale at startup.
+Re-run after changing a layer image or its scale factor.
+"""
+
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from config import WIDTH, HEIGHT
+from levels.background import LayeredBackground, prescaled_path
+
+BACKGROUND_FOLDERS = ["Background layers", "Futuristic City Parallax"]
+
+
+def prescale_folder(folder):
+    """Save every scaled layer of one background folder, returning how many were written"""
+    written = 0
+    for layer in LayeredBackground(background_folder=folder).layers:
+        if layer.scale_factor == 1.0:
+            continue
+        path = prescaled_path(layer.image_path, layer.scale_factor)
+        pygame.image.save(layer.image, path)
+        print(f"✅ {path} ({layer.scaled_width}x{layer.scaled_height})")
+        written += 1
+    return written
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    
+    total = 0
+    for folder in BACKGROUND_FOLDERS:
+        if not os.path.exists(folder):
+            print(f"❌ Background folder '{folder}' not found")
+            continue
+        total += prescale_folder(folder)
+    
+    pygame.quit()
+    print(f"\n🎨 Wrote {total} pre-scaled background layers")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
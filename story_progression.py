@@ -2,6 +2,52 @@ import json
 import os
 import time
 
+# Dialogue tables are fixed text, built once at import rather than on every lookup
+STORY_DIALOGUES = {
+    0: (  # Intro - no items
+        "Welcome, Luna...",
+        "You find yourself in a dangerous forest.",
+        "You must survive with only your sword.",
+        "Remember - each death teaches you something new...",
+        "Press R to begin your endless lesson!"
+    ),
+    1: (  # After first death - hearts unlocked
+        "Luna, you have fallen... but learned.",
+        "I sense your growing wisdom.",
+        "I grant you the power of healing hearts.",
+        "HEART CONTROLS:",
+        "I - Open/Close Inventory",
+        "1-0 - Select Heart Slot",
+        "W - Use Selected Heart",
+        "Use them wisely to survive longer.",
+        "Each death brings new understanding..."
+    ),
+    2: (  # After second death - bow unlocked
+        "Luna, your persistence has impressed me...",
+        "You have learned the value of healing.",
+        "Now I grant you the ancient bow and arrows.",
+        "A Special bow for you, Luna!",
+        "This bow can shoot arrows that pierce through walls.",
+        "BOW CONTROLS:",
+        "E - Switch Sword/Bow",
+        "F - Fire Arrow (when bow selected)",
+        "Arrow Keys - Aim Direction",
+    )
+}
+
+INTRO_DIALOGUE = (
+    "Welcome to Luna's Endless Lesson",
+    "A tale of learning through failure...",
+    "",
+    "CONTROLS:",
+    "Arrow Keys - Move Left/Right",
+    "SPACE - Jump",
+    "F - Attack with Sword",
+    "",
+    
+    "Press R to begin Luna's journey!"
+)
+
 class StoryProgression:
     def __init__(self, save_file="story_progress.json"):
         self.save_file = save_file
@@ -76,55 +122,13 @@ class StoryProgression:
         """Get dialogue for specific story part"""
         # Skip dialogue after 4 deaths
         if self.progress["deaths"] >= 4:
-            return []
+            return ()
             
-        dialogues = {
-            0: [  # Intro - no items
-                "Welcome, Luna...",
-                "You find yourself in a dangerous forest.",
-                "You must survive with only your sword.",
-                "Remember - each death teaches you something new...",
-                "Press R to begin your endless lesson!"
-            ],
-            1: [  # After first death - hearts unlocked
-                "Luna, you have fallen... but learned.",
-                "I sense your growing wisdom.",
-                "I grant you the power of healing hearts.",
-                "HEART CONTROLS:",
-                "I - Open/Close Inventory",
-                "1-0 - Select Heart Slot",
-                "W - Use Selected Heart",
-                "Use them wisely to survive longer.",
-                "Each death brings new understanding..."
-            ],
-            2: [  # After second death - bow unlocked
-                "Luna, your persistence has impressed me...",
-                "You have learned the value of healing.",
-                "Now I grant you the ancient bow and arrows.",
-                "A Special bow for you, Luna!",
-                "This bow can shoot arrows that pierce through walls.",
-                "BOW CONTROLS:",
-                "E - Switch Sword/Bow",
-                "F - Fire Arrow (when bow selected)",
-                "Arrow Keys - Aim Direction",
-            ]
-        }
-        return dialogues.get(story_part, [])
+        return STORY_DIALOGUES.get(story_part, ())
     
     def get_intro_dialogue(self):
         """Get intro dialogue"""
-        return [
-            "Welcome to Luna's Endless Lesson",
-            "A tale of learning through failure...",
-            "",
-            "CONTROLS:",
-            "Arrow Keys - Move Left/Right",
-            "SPACE - Jump",
-            "F - Attack with Sword",
-            "",
-            
-            "Press R to begin Luna's journey!"
-        ]
+        return INTRO_DIALOGUE
     
     def save_inventory(self, inventory_items):
         """Save inventory items to progress"""
@@ -134,6 +138,13 @@ class StoryProgression:
     def load_inventory(self):
         """Load inventory items from progress"""
         return self.progress.get("inventory", [])
+
+    def get_inventory_counts(self):
+        """Return saved item quantities keyed by item type"""
+        counts = {}
+        for item in self.progress.get("inventory", []):
+            counts.setdefault(item.get("type"), item.get("quantity", 0))
+        return counts
     
     def check_for_heart_purchases(self, api_client, system_id):
         """Check for heart purchases from API and update local file"""